@@ -14,14 +14,20 @@ import streamlit as st
 import os
 import sys
 import subprocess
-import datetime
 import shutil
 import re
 import glob
 import time
 import unicodedata
 import json
+import asyncio
+import threading
+from pathlib import Path
+from collections import defaultdict, deque
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
 import altair as alt
 import streamlit.components.v1 as components
 
@@ -116,13 +122,18 @@ def ensure_config_exists():
 # Run this immediately on app launch
 ensure_config_exists()
 
+@st.cache_data(show_spinner=False)
+def _read_config(cfg_path, mtime):
+    # mtime is only part of the cache key: editing config.json invalidates the cached parse.
+    with open(cfg_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_config():
     app_dir = os.path.dirname(os.path.abspath(__file__))
     cfg_path = os.path.join(app_dir, "src", "antarbhukti", "config.json")
     if not os.path.exists(cfg_path):
         return []
-    with open(cfg_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_config(cfg_path, os.path.getmtime(cfg_path))
 
 # ---------------------------
 # DATA: Upgrade Templates
@@ -378,12 +389,27 @@ st.markdown("""
 # ---------------------------
 # Helper: Data Processing
 # ---------------------------
+# Batch CSVs go through Arrow's multithreaded reader/writer (pyarrow ships with streamlit).
+def write_batch_csv(df, path):
+    try:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns (e.g. "" next to numbers) cannot be typed by Arrow.
+        df.to_csv(path, index=False)
+
+def read_batch_csv(path):
+    try:
+        return pacsv.read_csv(path).to_pandas()
+    except pa.ArrowInvalid:
+        return pd.read_csv(path)
+
+LLM_PREFIXES = ["GPT4o", "Gemini", "LLaMA", "Claude", "Perplexity"]
+
 def parse_csv_to_long_format(df, source_filename="unknown"):
     standardized_rows = []
-    llm_prefixes = ["GPT4o", "Gemini", "LLaMA", "Claude", "Perplexity"]
 
     for _, row in df.iterrows():
-        for llm in llm_prefixes:
+        for llm in LLM_PREFIXES:
             iter_col = f"{llm}_iter"
             time_col = f"{llm}_time"
             token_col = f"{llm}_tokens"
@@ -409,6 +435,31 @@ def parse_csv_to_long_format(df, source_filename="unknown"):
                     continue
     return standardized_rows
 
+def batch_metric_means(df):
+    """
+    Columnar version of averaging parse_csv_to_long_format(df)'s Time/Tokens, without building
+    the long-format rows. An LLM cell counts when its _iter is numeric; missing time/tokens count as 0,
+    and a time/tokens value that is not a number drops the cell, as the float() there does.
+    Returns (n_runs, mean_time, mean_tokens).
+    """
+    llms = [llm for llm in LLM_PREFIXES if f"{llm}_iter" in df.columns]
+    if not llms or df.empty:
+        return 0, 0.0, 0.0
+    def block(suffix, missing=np.nan):
+        cols = []
+        for llm in llms:
+            col = f"{llm}_{suffix}"
+            raw = df[col] if col in df.columns else pd.Series(np.nan, index=df.index)
+            # Empty cells become `missing`; anything else that is not a number is coerced to NaN.
+            raw = raw.mask(raw.isna() | (raw == ""), missing)
+            cols.append(pd.to_numeric(raw, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan))
+        return np.column_stack(cols).ravel()
+    runs = pd.DataFrame({"iter": block("iter"), "time": block("time", 0.0), "tokens": block("tokens", 0.0)})
+    runs = runs.dropna()
+    if runs.empty:
+        return 0, 0.0, 0.0
+    return len(runs), float(runs["time"].mean()), float(runs["tokens"].mean())
+
 # --- NEW: Smart Stats Helper (JOB BASED) ---
 # Find def get_filesystem_stats(...) and replace it with:
 
@@ -449,6 +500,77 @@ def get_filesystem_stats(root_dir="outputs", start_timestamp=0):
     
     return total_unique_jobs, rate
 
+def _scandir(path):
+    """Entries of path, or [] if it vanished or can't be read; the iterator is always closed."""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+def iter_artifacts(root="outputs"):
+    """
+    Yields (DirEntry, model, status) for files in <root>/<model>/<success|failed>/.
+    Depth is capped at the layout driver.py writes, so unrelated subtrees are never walked.
+    Directories that disappear or can't be read mid-scan are skipped.
+    """
+    for model_entry in _scandir(root):
+        if not model_entry.is_dir():
+            continue
+        for status_entry in _scandir(model_entry.path):
+            if status_entry.name not in ("success", "failed") or not status_entry.is_dir():
+                continue
+            for f in _scandir(status_entry.path):
+                if f.is_file():
+                    yield f, model_entry.name, status_entry.name
+
+def artifacts_signature(root="outputs"):
+    """Cheap cache key: mtimes of the status dirs change whenever driver.py adds a file."""
+    sig = []
+    for model_entry in _scandir(root):
+        if not model_entry.is_dir():
+            continue
+        for status_entry in _scandir(model_entry.path):
+            if status_entry.name in ("success", "failed"):
+                try:
+                    sig.append((status_entry.path, status_entry.stat().st_mtime_ns))
+                except OSError:
+                    continue
+    return tuple(sorted(sig))
+
+@st.cache_data(show_spinner=False)
+def list_report_runs(root, signature):
+    # One pass over the scan, grouped by run; only the (much smaller) set of runs gets sorted.
+    runs = defaultdict(lambda: {"html": None, "txt": None, "status": None, "time": 0.0})
+    for f, model_name, status in iter_artifacts(root):
+        base_name, ext = os.path.splitext(f.name)
+        try: mtime = f.stat().st_mtime
+        except OSError: continue
+        status_icon = "✅" if status == "success" else "❌"
+        run = runs[f"{status_icon} {model_name} - {base_name}"]
+        run["status"] = status
+        if mtime > run["time"]: run["time"] = mtime
+        if ext == ".html": run["html"] = f.path
+        elif ext == ".txt": run["txt"] = f.path
+    # Plain dict so st.cache_data can pickle it; newest run first for the selectbox.
+    return dict(sorted(runs.items(), key=lambda kv: kv[1]["time"], reverse=True))
+
+# Reports above this size are only embedded on request; components.html inlines the whole document.
+INLINE_REPORT_MAX_BYTES = 2 * 1024 * 1024
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def read_report_html(path, mtime):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False)
+def _batch_long(path, mtime):
+    """Long-format rows for one batch CSV; mtime is only the cache key, so rewritten files are re-parsed."""
+    return parse_csv_to_long_format(read_batch_csv(path), os.path.basename(path))
+
+CHART_MAX_POINTS = 5000
+CHART_SAMPLE_PER_MODEL = 1000
+
 def load_historical_data(result_root="outputs"):
     all_files = glob.glob(os.path.join(result_root, "batch_report_*.csv"))
     if not all_files:
@@ -462,9 +584,7 @@ def load_historical_data(result_root="outputs"):
     all_standardized_rows = []
     for filename in all_files:
         try:
-            df = pd.read_csv(filename)
-            rows = parse_csv_to_long_format(df, os.path.basename(filename))
-            all_standardized_rows.extend(rows)
+            all_standardized_rows.extend(_batch_long(filename, os.path.getmtime(filename)))
         except Exception:
             continue
             
@@ -542,10 +662,109 @@ with st.sidebar:
         help="Select one or multiple models. They will run sequentially for each file."
     )
 
-def add_log_text(logs, msg, panel):
-    logs += f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {msg}\n"
-    panel.text_area("Console Stream", logs, height=400, label_visibility="collapsed")
-    return logs
+# Console rendering is throttled: re-sending the whole text_area per line is O(N^2) over a run.
+LOG_MAX_LINES = 500
+LOG_FLUSH_INTERVAL = 0.2  # seconds
+
+# Log prefixes only have seconds resolution, so format once per second rather than once per line.
+_last_ts = [0, ""]
+
+def _ts():
+    sec = int(time.time())
+    if sec != _last_ts[0]:
+        _last_ts[0], _last_ts[1] = sec, time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_ts[1]
+
+def add_log_text(log_buf, msg):
+    log_buf.append(f"[{_ts()}] {msg}")
+
+def flush_log(log_buf, panel):
+    panel.text_area("Console Stream", "\n".join(log_buf), height=400, label_visibility="collapsed")
+
+async def flush_periodically(flush, interval=LOG_FLUSH_INTERVAL):
+    while True:
+        await asyncio.sleep(interval)
+        flush()
+
+# ---------------------------
+# Helper: Per-Pair Verification Job
+# ---------------------------
+def build_driver_command(result_root, selected_llms):
+    """
+    Loop-invariant part of the driver.py invocation, computed once per batch.
+    Returns (cmd_head, cmd_tail); run_pair splices --src_path/--mod_path in between.
+    Every path is absolute: each pair's driver.py runs in its own working directory.
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    driver_path = os.path.join(app_dir, "src", "antarbhukti", "driver.py")
+    prompt_file = os.path.join(app_dir, "prompts", "original", "iterative_prompting.txt")
+    os.makedirs(os.path.dirname(prompt_file), exist_ok=True)
+    if not os.path.exists(prompt_file):
+        with open(prompt_file, "w") as ph: ph.write("Provide PLC upgrade rules.")
+    llm_arg = ",".join([x.lower() for x in selected_llms])
+    cmd_head = [sys.executable, "-u", driver_path]
+    cmd_tail = ["--result_root", os.path.abspath(result_root), "--prompt_path", prompt_file, "--config_path", os.path.join(os.path.dirname(driver_path), "config.json"), "--llms", llm_arg]
+    return cmd_head, cmd_tail
+
+# SFC sources are tiny: one write_bytes() beats a buffered handle. Huge uploads are streamed instead.
+LARGE_UPLOAD_BYTES = 8 * 1024 * 1024
+
+def save_upload(uploaded, dest_dir):
+    dest = Path(dest_dir, uploaded.name)
+    if uploaded.size <= LARGE_UPLOAD_BYTES:
+        dest.write_bytes(uploaded.getbuffer())
+    else:
+        uploaded.seek(0)
+        with open(dest, "wb") as f: shutil.copyfileobj(uploaded, f, 1024 * 1024)
+    return str(dest)
+
+# asyncio's StreamReader rejects lines over its limit (64 KiB by default); driver.py can print long SFC dumps.
+PIPE_LINE_LIMIT = 1024 * 1024
+
+def purge_stale_uploads(root, keep):
+    """Deletes previous batches under root in a daemon thread, so a large old tree never blocks batch start."""
+    try:
+        with os.scandir(root) as it:
+            stale = [e.path for e in it if e.name != keep]
+    except OSError: return
+    def _purge():
+        for path in stale:
+            if os.path.isdir(path): shutil.rmtree(path, ignore_errors=True)
+            else:
+                try: os.remove(path)
+                except OSError: pass
+    threading.Thread(target=_purge, daemon=True).start()
+
+async def run_pair(i, pair, cmd_head, cmd_tail, base_env, uploads_dir, part_csv_path, on_line):
+    """
+    Runs driver.py for one (orig, mod) pair as an asyncio subprocess.
+    The event loop runs on the script thread, so on_line(i, line) may call Streamlit directly.
+    Returns (retcode, error_message).
+    """
+    pair_id = f"job_{i}"
+    pair_dir = os.path.abspath(os.path.join(uploads_dir, pair_id))
+    old_dir, new_dir = os.path.join(pair_dir, "old"), os.path.join(pair_dir, "new")
+    # driver.py writes sfc1/pn1/sfc2/pn2 .dot/.png under fixed names in its cwd; one directory per pair.
+    work_dir = os.path.join(pair_dir, "work")
+    try:
+        os.makedirs(old_dir, exist_ok=True)
+        os.makedirs(new_dir, exist_ok=True)
+        os.makedirs(work_dir, exist_ok=True)
+        save_upload(pair['orig'], old_dir)
+        save_upload(pair['mod'], new_dir)
+        cmd = cmd_head + ["--src_path", old_dir, "--mod_path", new_dir] + cmd_tail
+        # Each pair gets its own CSV: driver.py does a read-modify-write on it, so a shared file would race.
+        env_vars = dict(base_env, BENCHMARK_CSV_PATH=part_csv_path)
+        process = await asyncio.create_subprocess_exec(*cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT, env=env_vars, cwd=work_dir, limit=PIPE_LINE_LIMIT)
+        async for raw in process.stdout: on_line(i, raw.decode("utf-8", errors="replace").rstrip())
+        return await process.wait(), None
+    except Exception as e:
+        return -1, str(e)
+
+def merge_batch_csvs(part_paths, dest_path):
+    frames = [read_batch_csv(p) for p in part_paths if os.path.exists(p)]
+    if frames:
+        write_batch_csv(pd.concat(frames, ignore_index=True), dest_path)
 
 # ---------------------------
 # MAIN TABS
@@ -586,6 +805,9 @@ with tab_dash:
         with col_g1:
             st.markdown("**Time vs. Iteration Analysis**")
             chart_df = df_history[df_history['Time'] > 0]
+            # The whole frame is shipped to the browser as JSON; keep a fixed per-model sample on big histories.
+            if len(chart_df) > CHART_MAX_POINTS:
+                chart_df = chart_df.sample(frac=1, random_state=0).groupby("Model").head(CHART_SAMPLE_PER_MODEL)
             if not chart_df.empty:
                 chart = alt.Chart(chart_df).mark_circle(size=80).encode(
                     x=alt.X('Iteration', title='Iterations', axis=alt.Axis(tickMinStep=1, format='d')),
@@ -726,44 +948,57 @@ with tab_run:
             
             if not valid_pairs: st.error("No valid pairs created.")
             else:
-                if os.path.exists("uploads"): shutil.rmtree("uploads", ignore_errors=True)
                 result_root = "outputs"
                 os.makedirs(result_root, exist_ok=True)
                 timestamp = int(time.time())
+                # Each batch writes into its own uploads/<timestamp>; older batches are removed in the background.
+                uploads_dir = os.path.join("uploads", str(timestamp))
+                os.makedirs(uploads_dir, exist_ok=True)
+                purge_stale_uploads("uploads", keep=str(timestamp))
                 csv_filename = f"batch_report_{timestamp}.csv"
                 session_csv_path = os.path.abspath(os.path.join(result_root, csv_filename))
                 st.session_state.current_batch_csv = session_csv_path
                 progress_bar = st.progress(0)
                 st.info(f"Queued {len(valid_pairs)} pairs on {len(selected_llms)} models.")
                 
+                status_boxes, log_panels, log_bufs = [], [], []
                 for i, pair in enumerate(valid_pairs):
-                    pair_id = f"job_{i}"
-                    pair_dir = os.path.join("uploads", pair_id)
-                    old_dir, new_dir = os.path.join(pair_dir, "old"), os.path.join(pair_dir, "new")
-                    os.makedirs(old_dir, exist_ok=True)
-                    os.makedirs(new_dir, exist_ok=True)
-                    with open(os.path.join(old_dir, pair['orig'].name), "wb") as f: f.write(pair['orig'].getbuffer())
-                    with open(os.path.join(new_dir, pair['mod'].name), "wb") as f: f.write(pair['mod'].getbuffer())
-                    
-                    with st.status(f"[{i+1}/{len(valid_pairs)}] Verifying: {pair['name']}", expanded=True) as status:
-                        log_panel = st.empty(); logs = ""
-                        driver_path = os.path.join(os.path.dirname(__file__), "src", "antarbhukti", "driver.py")
-                        prompt_file = os.path.join(os.path.dirname(__file__), "prompts", "original", "iterative_prompting.txt")
-                        os.makedirs(os.path.dirname(prompt_file), exist_ok=True)
-                        if not os.path.exists(prompt_file):
-                            with open(prompt_file, "w") as ph: ph.write("Provide PLC upgrade rules.")
-                        llm_arg = ",".join([x.lower() for x in selected_llms])
-                        cmd = [sys.executable, "-u", driver_path, "--src_path", old_dir, "--mod_path", new_dir, "--result_root", result_root, "--prompt_path", prompt_file, "--config_path", os.path.join(os.path.dirname(driver_path), "config.json"), "--llms", llm_arg]
-                        env_vars = os.environ.copy()
-                        env_vars["BENCHMARK_CSV_PATH"] = session_csv_path
-                        try:
-                            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, env=env_vars)
-                            for line in process.stdout: logs = add_log_text(logs, line.rstrip(), log_panel)
-                            retcode = process.wait()
-                            if retcode == 0: status.update(label=f"✅ Verified: {pair['name']}", state="complete", expanded=False)
-                            else: status.update(label=f"❌ Failed: {pair['name']}", state="error", expanded=False)
-                        except Exception as e: status.update(label="❌ Critical Error", state="error"); st.error(str(e))
-                    progress_bar.progress((i + 1) / len(valid_pairs))
+                    status = st.status(f"[{i+1}/{len(valid_pairs)}] Verifying: {pair['name']}", expanded=True)
+                    with status: log_panels.append(st.empty())
+                    status_boxes.append(status); log_bufs.append(deque(maxlen=LOG_MAX_LINES))
+
+                # Pairs are independent subprocesses, so drain them concurrently on one event loop; the LLM calls dominate.
+                part_csvs = [os.path.abspath(os.path.join(uploads_dir, f"job_{i}", "batch_part.csv")) for i in range(len(valid_pairs))]
+                cmd_head, cmd_tail = build_driver_command(result_root, selected_llms)
+                base_env = os.environ.copy()
+                max_workers = min(len(valid_pairs), os.cpu_count() or 1, 8)
+                completed, dirty = [0], set()
+
+                def on_line(j, line):
+                    add_log_text(log_bufs[j], line); dirty.add(j)
+
+                def flush_dirty():
+                    for j in dirty: flush_log(log_bufs[j], log_panels[j])
+                    dirty.clear()
+
+                async def verify_pair(j, pair, limiter):
+                    async with limiter:
+                        retcode, err = await run_pair(j, pair, cmd_head, cmd_tail, base_env, uploads_dir, part_csvs[j], on_line)
+                    flush_dirty()
+                    if err: status_boxes[j].update(label="❌ Critical Error", state="error"); status_boxes[j].error(err)
+                    elif retcode == 0: status_boxes[j].update(label=f"✅ Verified: {pair['name']}", state="complete", expanded=False)
+                    else: status_boxes[j].update(label=f"❌ Failed: {pair['name']}", state="error", expanded=False)
+                    completed[0] += 1
+                    progress_bar.progress(completed[0] / len(valid_pairs))
+
+                async def verify_batch():
+                    limiter = asyncio.Semaphore(max_workers)
+                    ticker = asyncio.create_task(flush_periodically(flush_dirty))
+                    try: await asyncio.gather(*(verify_pair(j, pair, limiter) for j, pair in enumerate(valid_pairs)))
+                    finally: ticker.cancel()
+
+                asyncio.run(verify_batch())
+                merge_batch_csvs(part_csvs, session_csv_path)
                 st.success("Batch Queue Processed Successfully!")
 
 # --- TAB 5: REPORTS ---
@@ -783,11 +1018,9 @@ with tab_report:
             # Get Stats for THIS Batch
             b_total, b_success_rate = get_filesystem_stats("outputs", start_timestamp=batch_start_time)
             
-            df = pd.read_csv(current_csv)
-            rows = parse_csv_to_long_format(df, os.path.basename(current_csv))
-            if rows:
-                batch_df = pd.DataFrame(rows)
-                b_time, b_tokens = batch_df['Time'].mean(), batch_df['Tokens'].mean()
+            df = read_batch_csv(current_csv)
+            b_runs, b_time, b_tokens = batch_metric_means(df)
+            if b_runs:
                 mc1, mc2, mc3, mc4 = st.columns(4)
                 mc1.metric("Verifications Run", f"{b_total}", delta="Current Batch")
                 mc2.metric("Success Rate", f"{b_success_rate:.1f}%", delta="Real-Time")
@@ -801,36 +1034,20 @@ with tab_report:
 
     st.divider()
     st.markdown("### 2. Detailed Verification Artifacts")
-    report_items = []
-    for root, dirs, files in os.walk("outputs"):
-        if "success" in root or "failed" in root:
-            for file in files:
-                full_path = os.path.join(root, file)
-                base_name = os.path.splitext(file)[0]
-                try: model_name = os.path.basename(os.path.dirname(os.path.dirname(full_path)))
-                except: model_name = "Unknown"
-                item = {"path": full_path, "file": file, "base": base_name, "ext": os.path.splitext(file)[1], "model": model_name, "time": os.path.getmtime(full_path), "status": "success" if "success" in root else "failed"}
-                report_items.append(item)
-    
-    if report_items:
-        report_items.sort(key=lambda x: x["time"], reverse=True)
-        unique_runs = {}
-        for item in report_items:
-            status_icon = "✅" if item["status"] == "success" else "❌"
-            key = f"{status_icon} {item['model']} - {item['base']}"
-            if key not in unique_runs: unique_runs[key] = {"html": None, "txt": None, "status": item["status"]}
-            if item["ext"] == ".html": unique_runs[key]["html"] = item["path"]
-            elif item["ext"] == ".txt": unique_runs[key]["txt"] = item["path"]
-        
+    unique_runs = list_report_runs("outputs", artifacts_signature("outputs"))
+
+    if unique_runs:
         col_sel, col_empty = st.columns([0.5, 0.5])
         with col_sel: selected_run_key = st.selectbox("Select Verification Run to Inspect", list(unique_runs.keys()))
         selected_run = unique_runs[selected_run_key]
         
         if selected_run["html"]:
-            with open(selected_run["html"], 'r', encoding='utf-8') as f:
-                html_code = f.read()
-                st.download_button("📥 Download HTML Report", html_code, file_name=os.path.basename(selected_run["html"]), mime="text/html", key="dl_html")
-                components.html(html_code, height=1200, scrolling=True)
+            html_path = selected_run["html"]
+            html_stat = os.stat(html_path)
+            # Download from the raw bytes; the decoded str is only materialized when the preview renders.
+            with open(html_path, "rb") as f: st.download_button("📥 Download HTML Report", f, file_name=os.path.basename(html_path), mime="text/html", key="dl_html")
+            if html_stat.st_size <= INLINE_REPORT_MAX_BYTES or st.toggle(f"Render large report inline ({html_stat.st_size / 1_048_576:.1f} MB)", key="render_large_html"):
+                components.html(read_report_html(html_path, html_stat.st_mtime), height=1200, scrolling=True)
         elif selected_run["status"] == "failed": st.warning("⚠️ No HTML Report found for this failure. Check console logs.")
         
         if selected_run["txt"]:
@@ -1,863 +1,968 @@
-oscat_examples = [
-    {
-        "name": "Simple On-Off Control",
-        "steps": [
-            {"name": "Init", "function": "output := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "On", "function": "output := 1"},
-            {"name": "Off", "function": "output := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "On", "guard": "input > threshold"},
-            {"src": "Check", "tgt": "Off", "guard": "input <= threshold"},
-            {"src": "On", "tgt": "End", "guard": "True"},
-            {"src": "Off", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "threshold", "output", "init"]
-    },
-    {
-        "name": "Hysteresis Switch",
-        "steps": [
-            {"name": "Init", "function": "output := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "On", "function": "output := 1"},
-            {"name": "Off", "function": "output := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "On", "guard": "input > on_threshold"},
-            {"src": "Check", "tgt": "Off", "guard": "input < off_threshold"},
-            {"src": "On", "tgt": "Check", "guard": "True"},
-            {"src": "Off", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "End", "guard": "False"}
-        ],
-        "variables": ["input", "on_threshold", "off_threshold", "output", "init"]
-    },
-    {
-        "name": "Toggle by Rising Edge (T Flip-Flop)",
-        "steps": [
-            {"name": "Init", "function": "output := 0; last := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Toggle", "function": "output := 1 - output"},
-            {"name": "End", "function": "last := input"}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Toggle", "guard": "input == 1 and last == 0"},
-            {"src": "Toggle", "tgt": "End", "guard": "True"},
-            {"src": "Check", "tgt": "End", "guard": "input == 0 or last == 1"}
-        ],
-        "variables": ["input", "output", "last", "init"]
-    },
-    {
-        "name": "Delay On Timer",
-        "steps": [
-            {"name": "Init", "function": "timer := 0; output := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Count", "function": "timer := timer + 1"},
-            {"name": "On", "function": "output := 1"},
-            {"name": "Reset", "function": "timer := 0; output := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Count", "guard": "input == 1 and timer < delay"},
-            {"src": "Count", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "On", "guard": "input == 1 and timer >= delay"},
-            {"src": "On", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Reset", "guard": "input == 0"},
-            {"src": "Reset", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "timer", "delay", "output", "init"]
-    },
-    {
-        "name": "Delay Off Timer",
-        "steps": [
-            {"name": "Init", "function": "timer := 0; output := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "output := 1"},
-            {"name": "Count", "function": "timer := timer + 1"},
-            {"name": "Reset", "function": "timer := 0; output := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "input == 1"},
-            {"src": "Set", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Count", "guard": "input == 0 and timer < delay"},
-            {"src": "Count", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Reset",
-                "guard": "input == 0 and timer >= delay"},
-            {"src": "Reset", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "timer", "delay", "output", "init"]
-    },
-    {
-        "name": "Rising Edge Detection",
-        "steps": [
-            {"name": "Init", "function": "last := 0; edge := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Detect", "function": "edge := 1"},
-            {"name": "End", "function": "last := input; edge := 0"}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Detect", "guard": "input == 1 and last == 0"},
-            {"src": "Detect", "tgt": "End", "guard": "True"},
-            {"src": "Check", "tgt": "End", "guard": "input == 0 or last == 1"}
-        ],
-        "variables": ["input", "last", "edge", "init"]
-    },
-    {
-        "name": "Falling Edge Detection",
-        "steps": [
-            {"name": "Init", "function": "last := 1; edge := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Detect", "function": "edge := 1"},
-            {"name": "End", "function": "last := input; edge := 0"}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Detect", "guard": "input == 0 and last == 1"},
-            {"src": "Detect", "tgt": "End", "guard": "True"},
-            {"src": "Check", "tgt": "End", "guard": "input == 1 or last == 0"}
-        ],
-        "variables": ["input", "last", "edge", "init"]
-    },
-    {
-        "name": "Pulse Generator (fixed width)",
-        "steps": [
-            {"name": "Init", "function": "timer := 0; pulse := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "StartPulse", "function": "pulse := 1; timer := 1"},
-            {"name": "Pulse", "function": "timer := timer + 1"},
-            {"name": "StopPulse", "function": "pulse := 0; timer := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "StartPulse", "guard": "trigger == 1"},
-            {"src": "StartPulse", "tgt": "Pulse", "guard": "True"},
-            {"src": "Pulse", "tgt": "Pulse", "guard": "timer < width"},
-            {"src": "Pulse", "tgt": "StopPulse", "guard": "timer >= width"},
-            {"src": "StopPulse", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["trigger", "timer", "width", "pulse", "init"]
-    },
-    {
-        "name": "Up Counter",
-        "steps": [
-            {"name": "Init", "function": "cnt := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Count", "function": "cnt := cnt + 1"},
-            {"name": "Reset", "function": "cnt := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Count", "guard": "input == 1 and cnt < max"},
-            {"src": "Count", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1"},
-            {"src": "Reset", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "reset", "cnt", "max", "init"]
-    },
-    {
-        "name": "Down Counter",
-        "steps": [
-            {"name": "Init", "function": "cnt := max"},
-            {"name": "Check", "function": ""},
-            {"name": "Count", "function": "cnt := cnt - 1"},
-            {"name": "Reset", "function": "cnt := max"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Count", "guard": "input == 1 and cnt > 0"},
-            {"src": "Count", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1"},
-            {"src": "Reset", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "reset", "cnt", "max", "init"]
-    },
-    {
-        "name": "Comparator Greater",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a > b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a <= b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Comparator Less",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a < b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a >= b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Comparator Equal",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a == b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a != b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Comparator Not Equal",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a != b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a == b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Limit Upper Bound",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Clamp", "function": "out := upper"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Clamp", "guard": "input > upper"},
-            {"src": "Check", "tgt": "End", "guard": "input <= upper"},
-            {"src": "Clamp", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "upper", "out", "init"]
-    },
-    {
-        "name": "Limit Lower Bound",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Clamp", "function": "out := lower"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Clamp", "guard": "input < lower"},
-            {"src": "Check", "tgt": "End", "guard": "input >= lower"},
-            {"src": "Clamp", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "lower", "out", "init"]
-    },
-    {
-        "name": "Range Check",
-        "steps": [
-            {"name": "Init", "function": "in_range := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "in_range := 1"},
-            {"name": "Reset", "function": "in_range := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "input >= low and input <= high"},
-            {"src": "Check", "tgt": "Reset", "guard": "input < low or input > high"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "low", "high", "in_range", "init"]
-    },
-    {
-        "name": "Rate Limiter (Ramp)",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Inc", "function": "out := out + rate"},
-            {"name": "Dec", "function": "out := out - rate"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Inc", "guard": "out < input"},
-            {"src": "Check", "tgt": "Dec", "guard": "out > input"},
-            {"src": "Check", "tgt": "End", "guard": "out == input"},
-            {"src": "Inc", "tgt": "Check", "guard": "True"},
-            {"src": "Dec", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "out", "rate", "init"]
-    },
-    {
-        "name": "Deadband",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Pass", "function": "out := input"},
-            {"name": "Block", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Pass", "guard": "input > upper or input < lower"},
-            {"src": "Check", "tgt": "Block",
-                "guard": "input <= upper and input >= lower"},
-            {"src": "Pass", "tgt": "End", "guard": "True"},
-            {"src": "Block", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "upper", "lower", "out", "init"]
-    },
-    {
-        "name": "Absolute Value",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Negate", "function": "out := -input"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Negate", "guard": "input < 0"},
-            {"src": "Check", "tgt": "End", "guard": "input >= 0"},
-            {"src": "Negate", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "out", "init"]
-    },
-    {
-        "name": "Integrator",
-        "steps": [
-            {"name": "Init", "function": "sum := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Add", "function": "sum := sum + input"},
-            {"name": "Reset", "function": "sum := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Add", "guard": "enable == 1"},
-            {"src": "Add", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1"},
-            {"src": "Reset", "tgt": "Check", "guard": "True"}
-        ],
-        "variables": ["input", "enable", "reset", "sum", "init"]
-    },
-    {
-        "name": "Sample and Hold",
-        "steps": [
-            {"name": "Init", "function": "hold := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Sample", "function": "hold := input"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Sample", "guard": "sample == 1"},
-            {"src": "Check", "tgt": "End", "guard": "sample == 0"},
-            {"src": "Sample", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "sample", "hold", "init"]
-    },
-    {
-        "name": "S-R Latch",
-        "steps": [
-            {"name": "Init", "function": "q := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "q := 1"},
-            {"name": "Reset", "function": "q := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "s == 1"},
-            {"src": "Check", "tgt": "Reset", "guard": "r == 1"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["s", "r", "q", "init"]
-    },
-    {
-        "name": "D Latch",
-        "steps": [
-            {"name": "Init", "function": "q := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Latch", "function": "q := d"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Latch", "guard": "enable == 1"},
-            {"src": "Check", "tgt": "End", "guard": "enable == 0"},
-            {"src": "Latch", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["d", "enable", "q", "init"]
-    },
-    {
-        "name": "Up-Down Counter",
-        "steps": [
-            {"name": "Init", "function": "cnt := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Up", "function": "cnt := cnt + 1"},
-            {"name": "Down", "function": "cnt := cnt - 1"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Up", "guard": "up == 1"},
-            {"src": "Check", "tgt": "Down", "guard": "down == 1"},
-            {"src": "Check", "tgt": "End", "guard": "up == 0 and down == 0"},
-            {"src": "Up", "tgt": "End", "guard": "True"},
-            {"src": "Down", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["up", "down", "cnt", "init"]
-    },
-    {
-        "name": "Multiplexer (2-input)",
-        "steps": [
-            {"name": "Init", "function": "out := a"},
-            {"name": "Check", "function": ""},
-            {"name": "SetB", "function": "out := b"},
-            {"name": "SetA", "function": "out := a"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetB", "guard": "sel == 1"},
-            {"src": "Check", "tgt": "SetA", "guard": "sel == 0"},
-            {"src": "SetB", "tgt": "End", "guard": "True"},
-            {"src": "SetA", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "sel", "out", "init"]
-    },
-    {
-        "name": "Minimum Selector",
-        "steps": [
-            {"name": "Init", "function": "out := a"},
-            {"name": "Check", "function": ""},
-            {"name": "SetB", "function": "out := b"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetB", "guard": "b < a"},
-            {"src": "Check", "tgt": "End", "guard": "a <= b"},
-            {"src": "SetB", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Maximum Selector",
-        "steps": [
-            {"name": "Init", "function": "out := a"},
-            {"name": "Check", "function": ""},
-            {"name": "SetB", "function": "out := b"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetB", "guard": "b > a"},
-            {"src": "Check", "tgt": "End", "guard": "a >= b"},
-            {"src": "SetB", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Simple Arithmetic (a+b-c)",
-        "steps": [
-            {"name": "Init", "function": "out := a + b - c"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "End", "guard": "init"}
-        ],
-        "variables": ["a", "b", "c", "out", "init"]
-    },
-    {
-        "name": "Signum",
-        "steps": [
-            {"name": "Init", "function": "sgn := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "SetPos", "function": "sgn := 1"},
-            {"name": "SetNeg", "function": "sgn := -1"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetPos", "guard": "input > 0"},
-            {"src": "Check", "tgt": "SetNeg", "guard": "input < 0"},
-            {"src": "Check", "tgt": "End", "guard": "input == 0"},
-            {"src": "SetPos", "tgt": "End", "guard": "True"},
-            {"src": "SetNeg", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "sgn", "init"]
-    },
-    {
-        "name": "Increment If",
-        "steps": [
-            {"name": "Init", "function": "count := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Inc", "function": "count := count + 1"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Inc", "guard": "cond == 1"},
-            {"src": "Check", "tgt": "End", "guard": "cond == 0"},
-            {"src": "Inc", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["cond", "count", "init"]
-    },
-    {
-        "name": "Decrement If",
-        "steps": [
-            {"name": "Init", "function": "count := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Dec", "function": "count := count - 1"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Dec", "guard": "cond == 1"},
-            {"src": "Check", "tgt": "End", "guard": "cond == 0"},
-            {"src": "Dec", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["cond", "count", "init"]
-    },
-    {
-        "name": "Clamp in Range",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "ClampLow", "function": "out := low"},
-            {"name": "ClampHigh", "function": "out := high"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "ClampLow", "guard": "input < low"},
-            {"src": "Check", "tgt": "ClampHigh", "guard": "input > high"},
-            {"src": "Check", "tgt": "End", "guard": "input >= low and input <= high"},
-            {"src": "ClampLow", "tgt": "End", "guard": "True"},
-            {"src": "ClampHigh", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "low", "high", "out", "init"]
-    },
-    {
-        "name": "Invert",
-        "steps": [
-            {"name": "Init", "function": "out := -input"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "End", "guard": "init"}
-        ],
-        "variables": ["input", "out", "init"]
-    },
-    {
-        "name": "Resettable Counter",
-        "steps": [
-            {"name": "Init", "function": "count := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Inc", "function": "count := count + 1"},
-            {"name": "Reset", "function": "count := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Inc", "guard": "enable == 1"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1"},
-            {"src": "Inc", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["enable", "reset", "count", "init"]
-    },
-    {
-        "name": "Modulo Counter",
-        "steps": [
-            {"name": "Init", "function": "count := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Inc", "function": "count := (count + 1) % mod"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Inc", "guard": "enable == 1"},
-            {"src": "Check", "tgt": "End", "guard": "enable == 0"},
-            {"src": "Inc", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["enable", "mod", "count", "init"]
-    },
-    {
-        "name": "Comparator GE (>=)",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a >= b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a < b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Comparator LE (<=)",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := 1"},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "a <= b"},
-            {"src": "Check", "tgt": "Reset", "guard": "a > b"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "out", "init"]
-    },
-    {
-        "name": "Set-Reset Flip-Flop (priority to set)",
-        "steps": [
-            {"name": "Init", "function": "q := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "q := 1"},
-            {"name": "Reset", "function": "q := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "set == 1"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1 and set == 0"},
-            {"src": "Check", "tgt": "End", "guard": "set == 0 and reset == 0"},
-            {"src": "Set", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["set", "reset", "q", "init"]
-    },
-    {
-        "name": "Hold Last Value",
-        "steps": [
-            {"name": "Init", "function": "hold := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Hold", "function": "hold := input"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Hold", "guard": "enable == 1"},
-            {"src": "Check", "tgt": "End", "guard": "enable == 0"},
-            {"src": "Hold", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "enable", "hold", "init"]
-    },
-    {
-        "name": "Latch Until Reset",
-        "steps": [
-            {"name": "Init", "function": "q := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Latch", "function": "q := 1"},
-            {"name": "Reset", "function": "q := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Latch", "guard": "set == 1"},
-            {"src": "Check", "tgt": "Reset", "guard": "reset == 1"},
-            {"src": "Check", "tgt": "End", "guard": "set == 0 and reset == 0"},
-            {"src": "Latch", "tgt": "End", "guard": "True"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["set", "reset", "q", "init"]
-    },
-    {
-        "name": "Minimum of three",
-        "steps": [
-            {"name": "Init", "function": "min1 := a if a < b else b"},
-            {"name": "Check", "function": ""},
-            {"name": "Min2", "function": "min2 := min1 if min1 < c else c"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Min2", "guard": "True"},
-            {"src": "Min2", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "c", "min1", "min2", "init"]
-    },
-    {
-        "name": "Maximum of three",
-        "steps": [
-            {"name": "Init", "function": "max1 := a if a > b else b"},
-            {"name": "Check", "function": ""},
-            {"name": "Max2", "function": "max2 := max1 if max1 > c else c"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Max2", "guard": "True"},
-            {"src": "Max2", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["a", "b", "c", "max1", "max2", "init"]
-    },
-    {
-        "name": "Set value if condition",
-        "steps": [
-            {"name": "Init", "function": "out := 0"},
-            {"name": "Check", "function": ""},
-            {"name": "Set", "function": "out := val"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Set", "guard": "cond == 1"},
-            {"src": "Check", "tgt": "End", "guard": "cond == 0"},
-            {"src": "Set", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["cond", "val", "out", "init"]
-    },
-    {
-        "name": "Reset to default if condition",
-        "steps": [
-            {"name": "Init", "function": "out := val"},
-            {"name": "Check", "function": ""},
-            {"name": "Reset", "function": "out := defval"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Reset", "guard": "cond == 1"},
-            {"src": "Check", "tgt": "End", "guard": "cond == 0"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["cond", "val", "defval", "out", "init"]
-    },
-    {
-        "name": "Sign Flip If Condition",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Flip", "function": "out := -input"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Flip", "guard": "cond == 1"},
-            {"src": "Check", "tgt": "End", "guard": "cond == 0"},
-            {"src": "Flip", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "cond", "out", "init"]
-    },
-    {
-        "name": "Reset If Negative",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Reset", "guard": "input < 0"},
-            {"src": "Check", "tgt": "End", "guard": "input >= 0"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "out", "init"]
-    },
-    {
-        "name": "Set to Max if Exceeds",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "SetMax", "function": "out := maxval"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetMax", "guard": "input > maxval"},
-            {"src": "Check", "tgt": "End", "guard": "input <= maxval"},
-            {"src": "SetMax", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "maxval", "out", "init"]
-    },
-    {
-        "name": "Set to Min if Below",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "SetMin", "function": "out := minval"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "SetMin", "guard": "input < minval"},
-            {"src": "Check", "tgt": "End", "guard": "input >= minval"},
-            {"src": "SetMin", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "minval", "out", "init"]
-    },
-    {
-        "name": "Reset If Out Of Bounds",
-        "steps": [
-            {"name": "Init", "function": "out := input"},
-            {"name": "Check", "function": ""},
-            {"name": "Reset", "function": "out := 0"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Reset",
-                "guard": "input < minval or input > maxval"},
-            {"src": "Check", "tgt": "End",
-                "guard": "input >= minval and input <= maxval"},
-            {"src": "Reset", "tgt": "End", "guard": "True"}
-        ],
-        "variables": ["input", "minval", "maxval", "out", "init"]
+import ast
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from sys import intern
+from typing import NamedTuple
+
+def _record_item(record, key):
+    # Fields can also be read as record["name"], like the former dict records; other keys index the tuple.
+    if isinstance(key, str):
+        if key not in record._fields:
+            raise KeyError(key)
+        return getattr(record, key)
+    return tuple.__getitem__(record, key)
+
+
+# Immutable records: steps/transitions are tuples of these, so every FSM is hashable and compact.
+class Step(NamedTuple):
+    name: str
+    function: str  # ST assignments ("x := 1; y := 0"), "" for none
+
+    __getitem__ = _record_item
+
+
+class Transition(NamedTuple):
+    src: str
+    tgt: str
+    guard: str  # Python expression over the FSM variables
+
+    __getitem__ = _record_item
+
+
+class FSMSpec(namedtuple("FSMSpec", "name steps transitions variables")):
+    """One OSCAT benchmark FSM. Fields can also be read as spec["steps"][0]["name"], like the former dict records."""
+    __slots__ = ()
+
+    __getitem__ = _record_item
+
+    @property
+    def variable_set(self):
+        """The variables as a frozenset for membership tests; specs declaring the same variables share it."""
+        return _variable_set(self.variables)
+
+
+def _variables(text):
+    """Splits "a, b, out" into ("a", "b", "out")."""
+    return tuple(v.strip() for v in text.split(","))
+
+
+# Skeletons shared by several benchmarks; the factories differ only in guards and assignments.
+_CHECK = Step("Check", "")
+_END = Step("End", "")
+
+
+def _set_reset(name, set_guard, reset_guard, out="out", variables="a, b, out, init"):
+    """Init -> Check -> Set (out := 1) | Reset (out := 0) -> End: comparators, range check, S-R latch."""
+    return FSMSpec(
+        name,
+        (Step("Init", f"{out} := 0"), _CHECK, Step("Set", f"{out} := 1"), Step("Reset", f"{out} := 0"), _END),
+        (
+            Transition("Init", "Check", "init"),
+            Transition("Check", "Set", set_guard),
+            Transition("Check", "Reset", reset_guard),
+            Transition("Set", "End", "True"),
+            Transition("Reset", "End", "True"),
+        ),
+        _variables(variables),
+    )
+
+
+def _counter(name, start, step, enabled):
+    """Counter that steps cnt while input == 1 and the bound allows it; reset == 1 reloads start."""
+    return FSMSpec(
+        name,
+        (Step("Init", f"cnt := {start}"), _CHECK, Step("Count", f"cnt := {step}"), Step("Reset", f"cnt := {start}"), _END),
+        (
+            Transition("Init", "Check", "init"),
+            Transition("Check", "Count", f"input == 1 and {enabled}"),
+            Transition("Count", "Check", "True"),
+            Transition("Check", "Reset", "reset == 1"),
+            Transition("Reset", "Check", "True"),
+        ),
+        ("input", "reset", "cnt", "max", "init"),
+    )
+
+
+def _edge_detector(name, level):
+    """Sets edge when input changes to `level` (1: rising, 0: falling)."""
+    level = int(level)
+    idle = 1 - level
+    return FSMSpec(
+        name,
+        (Step("Init", f"last := {idle}; edge := 0"), _CHECK, Step("Detect", "edge := 1"),
+         Step("End", "last := input; edge := 0")),
+        (
+            Transition("Init", "Check", "init"),
+            Transition("Check", "Detect", f"input == {level} and last == {idle}"),
+            Transition("Detect", "End", "True"),
+            Transition("Check", "End", f"input == {idle} or last == {level}"),
+        ),
+        ("input", "last", "edge", "init"),
+    )
+
+
+def _override(name, init_fn, step_name, step_fn, take_guard, keep_guard, variables):
+    """Init assigns a default, then Check either overrides it in step_name or keeps it: limits, selectors."""
+    return FSMSpec(
+        name,
+        (Step("Init", init_fn), _CHECK, Step(step_name, step_fn), _END),
+        (
+            Transition("Init", "Check", "init"),
+            Transition("Check", step_name, take_guard),
+            Transition("Check", "End", keep_guard),
+            Transition(step_name, "End", "True"),
+        ),
+        _variables(variables),
+    )
+
+
+# The benchmark table. Each entry is a header line, "<kind> <name> | <field> | ...":
+#   FSM <name> | <variables>      followed by indented lines, one per step ("Name: function", or
+#                                 just "Name") and per transition ("Src -> Tgt: guard"), in
+#                                 declaration (= priority) order;
+#   <template> <name> | <args>    one of the skeletons above, called with the fields as arguments.
+_TABLE = """
+FSM Simple On-Off Control | input, threshold, output, init
+    Init: output := 0
+    Check
+    On: output := 1
+    Off: output := 0
+    End
+    Init -> Check: init
+    Check -> On: input > threshold
+    Check -> Off: input <= threshold
+    On -> End: True
+    Off -> End: True
+
+FSM Hysteresis Switch | input, on_threshold, off_threshold, output, init
+    Init: output := 0
+    Check
+    On: output := 1
+    Off: output := 0
+    End
+    Init -> Check: init
+    Check -> On: input > on_threshold
+    Check -> Off: input < off_threshold
+    On -> Check: True
+    Off -> Check: True
+    Check -> End: False
+
+FSM Toggle by Rising Edge (T Flip-Flop) | input, output, last, init
+    Init: output := 0; last := 0
+    Check
+    Toggle: output := 1 - output
+    End: last := input
+    Init -> Check: init
+    Check -> Toggle: input == 1 and last == 0
+    Toggle -> End: True
+    Check -> End: input == 0 or last == 1
+
+FSM Delay On Timer | input, timer, delay, output, init
+    Init: timer := 0; output := 0
+    Check
+    Count: timer := timer + 1
+    On: output := 1
+    Reset: timer := 0; output := 0
+    End
+    Init -> Check: init
+    Check -> Count: input == 1 and timer < delay
+    Count -> Check: True
+    Check -> On: input == 1 and timer >= delay
+    On -> Check: True
+    Check -> Reset: input == 0
+    Reset -> Check: True
+
+FSM Delay Off Timer | input, timer, delay, output, init
+    Init: timer := 0; output := 0
+    Check
+    Set: output := 1
+    Count: timer := timer + 1
+    Reset: timer := 0; output := 0
+    End
+    Init -> Check: init
+    Check -> Set: input == 1
+    Set -> Check: True
+    Check -> Count: input == 0 and timer < delay
+    Count -> Check: True
+    Check -> Reset: input == 0 and timer >= delay
+    Reset -> Check: True
+
+edge_detector Rising Edge Detection | 1
+edge_detector Falling Edge Detection | 0
+
+FSM Pulse Generator (fixed width) | trigger, timer, width, pulse, init
+    Init: timer := 0; pulse := 0
+    Check
+    StartPulse: pulse := 1; timer := 1
+    Pulse: timer := timer + 1
+    StopPulse: pulse := 0; timer := 0
+    End
+    Init -> Check: init
+    Check -> StartPulse: trigger == 1
+    StartPulse -> Pulse: True
+    Pulse -> Pulse: timer < width
+    Pulse -> StopPulse: timer >= width
+    StopPulse -> Check: True
+
+counter Up Counter | 0 | cnt + 1 | cnt < max
+counter Down Counter | max | cnt - 1 | cnt > 0
+set_reset Comparator Greater | a > b | a <= b
+set_reset Comparator Less | a < b | a >= b
+set_reset Comparator Equal | a == b | a != b
+set_reset Comparator Not Equal | a != b | a == b
+override Limit Upper Bound | out := input | Clamp | out := upper | input > upper | input <= upper | input, upper, out, init
+override Limit Lower Bound | out := input | Clamp | out := lower | input < lower | input >= lower | input, lower, out, init
+set_reset Range Check | input >= low and input <= high | input < low or input > high | in_range | input, low, high, in_range, init
+
+FSM Rate Limiter (Ramp) | input, out, rate, init
+    Init: out := input
+    Check
+    Inc: out := out + rate
+    Dec: out := out - rate
+    End
+    Init -> Check: init
+    Check -> Inc: out < input
+    Check -> Dec: out > input
+    Check -> End: out == input
+    Inc -> Check: True
+    Dec -> Check: True
+
+FSM Deadband | input, upper, lower, out, init
+    Init: out := 0
+    Check
+    Pass: out := input
+    Block: out := 0
+    End
+    Init -> Check: init
+    Check -> Pass: input > upper or input < lower
+    Check -> Block: input <= upper and input >= lower
+    Pass -> End: True
+    Block -> End: True
+
+override Absolute Value | out := input | Negate | out := -input | input < 0 | input >= 0 | input, out, init
+
+FSM Integrator | input, enable, reset, sum, init
+    Init: sum := 0
+    Check
+    Add: sum := sum + input
+    Reset: sum := 0
+    End
+    Init -> Check: init
+    Check -> Add: enable == 1
+    Add -> Check: True
+    Check -> Reset: reset == 1
+    Reset -> Check: True
+
+override Sample and Hold | hold := 0 | Sample | hold := input | sample == 1 | sample == 0 | input, sample, hold, init
+set_reset S-R Latch | s == 1 | r == 1 | q | s, r, q, init
+override D Latch | q := 0 | Latch | q := d | enable == 1 | enable == 0 | d, enable, q, init
+
+FSM Up-Down Counter | up, down, cnt, init
+    Init: cnt := 0
+    Check
+    Up: cnt := cnt + 1
+    Down: cnt := cnt - 1
+    End
+    Init -> Check: init
+    Check -> Up: up == 1
+    Check -> Down: down == 1
+    Check -> End: up == 0 and down == 0
+    Up -> End: True
+    Down -> End: True
+
+FSM Multiplexer (2-input) | a, b, sel, out, init
+    Init: out := a
+    Check
+    SetB: out := b
+    SetA: out := a
+    End
+    Init -> Check: init
+    Check -> SetB: sel == 1
+    Check -> SetA: sel == 0
+    SetB -> End: True
+    SetA -> End: True
+
+override Minimum Selector | out := a | SetB | out := b | b < a | a <= b | a, b, out, init
+override Maximum Selector | out := a | SetB | out := b | b > a | a >= b | a, b, out, init
+
+FSM Simple Arithmetic (a+b-c) | a, b, c, out, init
+    Init: out := a + b - c
+    End
+    Init -> End: init
+
+FSM Signum | input, sgn, init
+    Init: sgn := 0
+    Check
+    SetPos: sgn := 1
+    SetNeg: sgn := -1
+    End
+    Init -> Check: init
+    Check -> SetPos: input > 0
+    Check -> SetNeg: input < 0
+    Check -> End: input == 0
+    SetPos -> End: True
+    SetNeg -> End: True
+
+override Increment If | count := 0 | Inc | count := count + 1 | cond == 1 | cond == 0 | cond, count, init
+override Decrement If | count := 0 | Dec | count := count - 1 | cond == 1 | cond == 0 | cond, count, init
+
+FSM Clamp in Range | input, low, high, out, init
+    Init: out := input
+    Check
+    ClampLow: out := low
+    ClampHigh: out := high
+    End
+    Init -> Check: init
+    Check -> ClampLow: input < low
+    Check -> ClampHigh: input > high
+    Check -> End: input >= low and input <= high
+    ClampLow -> End: True
+    ClampHigh -> End: True
+
+FSM Invert | input, out, init
+    Init: out := -input
+    End
+    Init -> End: init
+
+FSM Resettable Counter | enable, reset, count, init
+    Init: count := 0
+    Check
+    Inc: count := count + 1
+    Reset: count := 0
+    End
+    Init -> Check: init
+    Check -> Inc: enable == 1
+    Check -> Reset: reset == 1
+    Inc -> End: True
+    Reset -> End: True
+
+override Modulo Counter | count := 0 | Inc | count := (count + 1) % mod | enable == 1 | enable == 0 | enable, mod, count, init
+set_reset Comparator GE (>=) | a >= b | a < b
+set_reset Comparator LE (<=) | a <= b | a > b
+
+FSM Set-Reset Flip-Flop (priority to set) | set, reset, q, init
+    Init: q := 0
+    Check
+    Set: q := 1
+    Reset: q := 0
+    End
+    Init -> Check: init
+    Check -> Set: set == 1
+    Check -> Reset: reset == 1 and set == 0
+    Check -> End: set == 0 and reset == 0
+    Set -> End: True
+    Reset -> End: True
+
+override Hold Last Value | hold := 0 | Hold | hold := input | enable == 1 | enable == 0 | input, enable, hold, init
+
+FSM Latch Until Reset | set, reset, q, init
+    Init: q := 0
+    Check
+    Latch: q := 1
+    Reset: q := 0
+    End
+    Init -> Check: init
+    Check -> Latch: set == 1
+    Check -> Reset: reset == 1
+    Check -> End: set == 0 and reset == 0
+    Latch -> End: True
+    Reset -> End: True
+
+FSM Minimum of three | a, b, c, min1, min2, init
+    Init: min1 := a if a < b else b
+    Check
+    Min2: min2 := min1 if min1 < c else c
+    End
+    Init -> Check: init
+    Check -> Min2: True
+    Min2 -> End: True
+
+FSM Maximum of three | a, b, c, max1, max2, init
+    Init: max1 := a if a > b else b
+    Check
+    Max2: max2 := max1 if max1 > c else c
+    End
+    Init -> Check: init
+    Check -> Max2: True
+    Max2 -> End: True
+
+override Set value if condition | out := 0 | Set | out := val | cond == 1 | cond == 0 | cond, val, out, init
+override Reset to default if condition | out := val | Reset | out := defval | cond == 1 | cond == 0 | cond, val, defval, out, init
+override Sign Flip If Condition | out := input | Flip | out := -input | cond == 1 | cond == 0 | input, cond, out, init
+override Reset If Negative | out := input | Reset | out := 0 | input < 0 | input >= 0 | input, out, init
+override Set to Max if Exceeds | out := input | SetMax | out := maxval | input > maxval | input <= maxval | input, maxval, out, init
+override Set to Min if Below | out := input | SetMin | out := minval | input < minval | input >= minval | input, minval, out, init
+override Reset If Out Of Bounds | out := input | Reset | out := 0 | input < minval or input > maxval | input >= minval and input <= maxval | input, minval, maxval, out, init
+"""
+
+
+_TEMPLATES = {"set_reset": _set_reset, "counter": _counter, "edge_detector": _edge_detector, "override": _override}
+
+
+def _parse_entry(header, body):
+    kind, _, rest = header.partition(" ")
+    name, *fields = (field.strip() for field in rest.split("|"))
+    if kind != "FSM":
+        return _TEMPLATES[kind](name, *fields)
+    steps, transitions = [], []
+    for line in body:
+        if "->" in line:
+            src, _, rest = line.partition("->")
+            tgt, _, guard = rest.partition(":")
+            transitions.append(Transition(src.strip(), tgt.strip(), guard.strip()))
+        else:
+            step, _, function = line.partition(":")
+            steps.append(Step(step.strip(), function.strip()))
+    return FSMSpec(name, tuple(steps), tuple(transitions), _variables(fields[0]))
+
+
+def _parse_table(text):
+    """Parses the _TABLE format into a tuple of FSMSpec, in table order."""
+    entries = []
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if line[0].isspace():
+            entries[-1][1].append(line.strip())
+        else:
+            entries.append((line.strip(), []))
+    return tuple(_parse_entry(header, body) for header, body in entries)
+
+
+def _build_specs():
+    """The benchmark table, built on first use (see __getattr__ below)."""
+    return _parse_table(_TABLE)
+
+
+# Hash-consing table: equal records (and equal steps/transitions tuples) across FSMs become one object.
+_CANON = {}
+
+
+def _hashcons(obj):
+    # Keyed by type too, so a Step never stands in for an equal plain tuple.
+    return _CANON.setdefault((type(obj), obj), obj)
+
+
+def _canonical(spec):
+    """Returns spec with every string interned and its records, step/transition and variables tuples shared."""
+    return FSMSpec(
+        intern(spec.name),
+        _hashcons(tuple(_hashcons(Step(intern(s.name), intern(s.function))) for s in spec.steps)),
+        _hashcons(tuple(_hashcons(Transition(intern(t.src), intern(t.tgt), intern(t.guard)))
+                        for t in spec.transitions)),
+        # ("input", "out", "init") and friends recur across many FSMs; equal variable lists end up as
+        # one tuple, so code binding variables can compare them with `is`.
+        _hashcons(tuple(map(intern, spec.variables))),
+    )
+
+
+def minimize(spec):
+    """
+    Merges steps that behave identically: same function and, guard by guard, equivalent targets
+    (Moore partition refinement). A merged group keeps its first step's name. Returns spec itself
+    when no steps merge. Pass-through steps are kept: every transition costs a scan cycle.
+    """
+    names = [s.name for s in spec.steps]
+    outgoing = {name: [] for name in names}
+    for t in spec.transitions:
+        outgoing[t.src].append(t)
+    block = {s.name: s.function for s in spec.steps}
+    n_blocks = len(set(block.values()))
+    while True:
+        signatures = {}
+        refined = {
+            name: signatures.setdefault((block[name], tuple((t.guard, block[t.tgt]) for t in outgoing[name])),
+                                        len(signatures))
+            for name in names
+        }
+        if len(signatures) == n_blocks:
+            break
+        block, n_blocks = refined, len(signatures)
+    if n_blocks == len(names):
+        return spec
+    first = {}
+    for name in names:
+        first.setdefault(refined[name], name)
+    kept = set(first.values())
+    return spec._replace(
+        steps=tuple(s for s in spec.steps if s.name in kept),
+        transitions=tuple(Transition(t.src, first[refined[t.tgt]], t.guard)
+                          for t in spec.transitions if t.src in kept),
+    )
+
+
+@lru_cache(maxsize=None)
+def _variable_set(variables):
+    return _hashcons(frozenset(variables))
+
+
+# Guards are Python expressions and step functions are ST assignments (":="). Each distinct text
+# is compiled once, so a simulator evaluates code objects instead of re-parsing source per tick.
+_GUARD_CACHE = {}
+_ACTION_CACHE = {}
+
+# Most guards are "True". Its shared code object doubles as a sentinel, so run_fsm can test
+# `guard is _ALWAYS` and skip evaluation; "False" edges are dropped.
+_ALWAYS = _GUARD_CACHE["True"] = _GUARD_CACHE[""] = compile("True", "<guard>", "eval")
+_NEVER = _GUARD_CACHE["False"] = compile("False", "<guard>", "eval")
+
+
+def guard_code(guard):
+    """Returns the compiled "eval" code object for a transition guard."""
+    code = _GUARD_CACHE.get(guard)
+    if code is None:
+        code = _GUARD_CACHE[guard] = compile(guard or "True", "<guard>", "eval")
+    return code
+
+
+def action_code(function):
+    """Returns the compiled "exec" code object for a step function, or None if the step has none."""
+    if not function:
+        return None
+    code = _ACTION_CACHE.get(function)
+    if code is None:
+        code = _ACTION_CACHE[function] = compile(function.replace(":=", "="), "<step>", "exec")
+    return code
+
+
+class _EnvLookups(ast.NodeTransformer):
+    """Turns every variable reference x into _env["x"]."""
+
+    def visit_Name(self, node):
+        return ast.copy_location(ast.Subscript(ast.Name("_env", ast.Load()), ast.Constant(node.id), ast.Load()), node)
+
+
+_GUARD_FN_CACHE = {}
+
+
+def guard_fn(guard):
+    """
+    Returns the guard as a function of the variables dict, e.g. "a > b" becomes
+    lambda _env: _env["a"] > _env["b"]. Calling it skips the frame and name-lookup setup of eval.
+    """
+    fn = _GUARD_FN_CACHE.get(guard)
+    if fn is None:
+        tree = ast.parse("lambda _env: None", mode="eval")
+        tree.body.body = _EnvLookups().visit(ast.parse(guard or "True", mode="eval").body)
+        code = compile(ast.fix_missing_locations(tree), "<guard>", "eval")
+        fn = _GUARD_FN_CACHE[guard] = eval(code, _EVAL_GLOBALS)
+    return fn
+
+
+# Micro-ops a step function is lexed into: (op, variable, argument). Most OSCAT step functions are
+# "x := 0", "x := 1", "x := x + 1" or "x := y", which run_fsm applies without calling eval.
+OP_SET0, OP_SET1, OP_INC, OP_DEC, OP_COPY, OP_EVAL = range(6)
+_OPS_CACHE = {}
+
+
+def _lex_assignment(lhs, rhs):
+    if rhs == "0":
+        return OP_SET0, lhs, None
+    if rhs == "1":
+        return OP_SET1, lhs, None
+    if rhs == lhs + " + 1":
+        return OP_INC, lhs, None
+    if rhs == lhs + " - 1":
+        return OP_DEC, lhs, None
+    if rhs.isidentifier():
+        return OP_COPY, lhs, intern(rhs)
+    return OP_EVAL, lhs, compile(rhs, "<step>", "eval")
+
+
+def action_ops(function):
+    """Returns the step function lexed into a tuple of (op, variable, argument) micro-ops, applied in order."""
+    ops = _OPS_CACHE.get(function)
+    if ops is None:
+        ops = []
+        for assignment in function.split(";"):
+            if assignment.strip():
+                lhs, rhs = assignment.split(":=")
+                ops.append(_lex_assignment(intern(lhs.strip()), " ".join(rhs.split())))
+        ops = _OPS_CACHE[function] = tuple(ops)
+    return ops
+
+
+def _apply_ops(ops, env):
+    for op, var, arg in ops:
+        if op == OP_SET0:
+            env[var] = 0
+        elif op == OP_SET1:
+            env[var] = 1
+        elif op == OP_INC:
+            env[var] += 1
+        elif op == OP_DEC:
+            env[var] -= 1
+        elif op == OP_COPY:
+            env[var] = env[arg]
+        else:
+            env[var] = eval(arg, _EVAL_GLOBALS, env)
+
+
+@lru_cache(maxsize=None)
+def _examples():
+    # Equal literals in this module already share one object; interning also makes strings built
+    # elsewhere (state names read from traces, parsed guards) resolve to them, so comparisons hit
+    # the identity fast path.
+    specs = tuple(_canonical(spec) for spec in _build_specs())
+    for spec in specs:
+        for t in spec.transitions:
+            guard_code(t.guard)
+        for s in spec.steps:
+            action_code(s.function)
+    return specs
+
+
+@lru_cache(maxsize=None)
+def _examples_by_name():
+    return {spec.name: spec for spec in _examples()}
+
+
+def get_example(name):
+    """Returns the benchmark FSM called name."""
+    return _examples_by_name()[name]
+
+
+_COLUMN_NAMES = frozenset({
+    "oscat_names", "oscat_step_names", "oscat_step_fns", "oscat_trans_src", "oscat_trans_tgt", "oscat_trans_guard",
+    "oscat_vars",
+})
+
+
+@lru_cache(maxsize=None)
+def _columns():
+    """Columnar view of the table: one tuple per field, indexed by example position."""
+    specs = _examples()
+    return {
+        "oscat_names": tuple(spec.name for spec in specs),
+        "oscat_step_names": tuple(tuple(s.name for s in spec.steps) for spec in specs),
+        "oscat_step_fns": tuple(tuple(s.function for s in spec.steps) for spec in specs),
+        "oscat_trans_src": tuple(tuple(t.src for t in spec.transitions) for spec in specs),
+        "oscat_trans_tgt": tuple(tuple(t.tgt for t in spec.transitions) for spec in specs),
+        "oscat_trans_guard": tuple(tuple(t.guard for t in spec.transitions) for spec in specs),
+        "oscat_vars": tuple(spec.variables for spec in specs),
     }
-]
 
-# Print example names
-for idx, example in enumerate(oscat_examples, 1):
-    print(f"OSCAT Example {idx}: {example['name']}")
+
+@lru_cache(maxsize=None)
+def _banner():
+    """The "OSCAT Example <n>: <name>" listing printed by the script, one line per example."""
+    return "".join(f"OSCAT Example {idx}: {name}\n" for idx, name in enumerate(_columns()["oscat_names"], 1))
+
+
+def __getattr__(name):
+    # PEP 562: importing this module only defines the builders; the table (and its compiled
+    # guards) is built the first time oscat_examples or one of the oscat_* columns is read.
+    if name == "oscat_examples":
+        return _examples()
+    if name in _COLUMN_NAMES:
+        return _columns()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def transitions_by_src(spec):
+    """Returns {step name: outgoing transitions in declaration (= priority) order} for spec."""
+    by_src = {}
+    for t in spec.transitions:
+        by_src.setdefault(t.src, []).append(t)
+    return {name: tuple(ts) for name, ts in by_src.items()}
+
+
+# Struct-of-arrays form of one FSM: states are numbered by step order (0 is the initial step), and
+# transitions are in CSR order: the edges leaving state s are offsets[s]:offsets[s + 1] of the int8
+# arrays tgt and guard_id, in priority order. guard_id indexes `guards` and `guard_fns`; action_id[state]
+# indexes `actions` and `ops` (-1 for steps without a function).
+EncodedFSM = namedtuple("EncodedFSM", "states variables offsets tgt guard_id action_id guards guard_fns actions ops")
+
+
+@lru_cache(maxsize=None)
+def encode(spec):
+    """Returns the EncodedFSM of spec, built once per spec."""
+    import numpy as np  # only the encoded and lane-wise paths need NumPy
+
+    state_ids = {s.name: i for i, s in enumerate(spec.steps)}
+    guard_ids, action_ids = {}, {}
+    for t in spec.transitions:
+        guard_ids.setdefault(t.guard, len(guard_ids))
+    for s in spec.steps:
+        if s.function:
+            action_ids.setdefault(s.function, len(action_ids))
+    src = np.fromiter((state_ids[t.src] for t in spec.transitions), dtype=np.int8, count=len(spec.transitions))
+    # A stable sort keeps declaration (= priority) order among edges leaving the same state.
+    order = np.argsort(src, kind="stable")
+    offsets = np.zeros(len(spec.steps) + 1, dtype=np.int16)
+    np.cumsum(np.bincount(src, minlength=len(spec.steps)), out=offsets[1:])
+    tgt = np.fromiter((state_ids[t.tgt] for t in spec.transitions), dtype=np.int8, count=len(spec.transitions))
+    guard_id = np.fromiter((guard_ids[t.guard] for t in spec.transitions), dtype=np.int8, count=len(spec.transitions))
+    return EncodedFSM(
+        states=tuple(s.name for s in spec.steps),
+        variables=spec.variables,
+        offsets=offsets,
+        tgt=tgt[order],
+        guard_id=guard_id[order],
+        action_id=np.fromiter((action_ids.get(s.function, -1) for s in spec.steps), dtype=np.int8, count=len(spec.steps)),
+        guards=tuple(map(guard_code, guard_ids)),
+        guard_fns=tuple(map(guard_fn, guard_ids)),
+        actions=tuple(map(action_code, action_ids)),
+        ops=tuple(map(action_ops, action_ids)),
+    )
+
+
+# Guards and step functions only reference FSM variables; no builtins are exposed to them.
+_EVAL_GLOBALS = {"__builtins__": {}}
+
+
+@lru_cache(maxsize=None)
+def is_trivial(spec):
+    """True for one-shot FSMs (e.g. Simple Arithmetic, Invert): Init -> End on a single guard, End inert."""
+    return (len(spec.steps) == 2 and len(spec.transitions) == 1 and not spec.steps[1].function
+            and spec.transitions[0][:2] == (spec.steps[0].name, spec.steps[1].name))
+
+
+def _run_trivial(spec, enc, trace):
+    # The Init function runs once up front; after that only the guard matters, and once End is
+    # reached the remaining cycles just apply their inputs.
+    env = dict.fromkeys(spec.variables, 0)
+    if enc.action_id[0] >= 0:
+        _apply_ops(enc.ops[enc.action_id[0]], env)
+    guard = enc.guard_fns[0]
+    cycles = iter(trace)
+    waiting = 0
+    for inputs in cycles:
+        env.update(inputs)
+        if guard(env):
+            break
+        waiting += 1
+    else:
+        return env, (enc.states[0],) * waiting
+    done = 1
+    for inputs in cycles:
+        env.update(inputs)
+        done += 1
+    return env, (enc.states[0],) * waiting + (enc.states[1],) * done
+
+
+def run_fsm(spec, trace):
+    """
+    Executes spec as an SFC over trace, a sequence of {variable: value} dicts applied one per scan cycle.
+    All variables start at 0 and the first step is active with its function already executed. Each cycle
+    applies its inputs, then fires the first enabled transition leaving the active step and runs the
+    target step's function. Returns (final variables, tuple of the active step after each cycle).
+    """
+    enc = encode(spec)
+    if is_trivial(spec):
+        return _run_trivial(spec, enc, trace)
+    # Outgoing edges per state as plain Python values (indexing NumPy scalars one at a time is slower),
+    # so a cycle only tests the active step's 1-3 guards.
+    offsets, tgt, guard_id = enc.offsets.tolist(), enc.tgt.tolist(), enc.guard_id.tolist()
+    # "True" edges get None so the loop can skip the call; "False" edges are dropped.
+    edges = [
+        [(None if enc.guards[guard_id[i]] is _ALWAYS else enc.guard_fns[guard_id[i]], tgt[i])
+         for i in range(offsets[s], offsets[s + 1]) if enc.guards[guard_id[i]] is not _NEVER]
+        for s in range(len(enc.states))
+    ]
+    actions = [enc.ops[a] if a >= 0 else None for a in enc.action_id.tolist()]
+    env = dict.fromkeys(spec.variables, 0)
+    state = 0
+    if actions[state] is not None:
+        _apply_ops(actions[state], env)
+    visited = []
+    for inputs in trace:
+        env.update(inputs)
+        for guard, nxt in edges[state]:
+            if guard is None or guard(env):
+                state = nxt
+                if actions[state] is not None:
+                    _apply_ops(actions[state], env)
+                break
+        visited.append(enc.states[state])
+    return env, tuple(visited)
+
+
+def _codegen(spec):
+    """Python source of a run(trace) function equivalent to run_fsm for spec, with the FSM inlined."""
+    enc = encode(spec)
+    by_src = transitions_by_src(spec)
+    state_ids = {name: i for i, name in enumerate(enc.states)}
+    variables = spec.variables
+    # Internal names start with "_" so they never collide with FSM variables.
+    lines = ["def run(_trace):", f"    {' = '.join(variables)} = 0", "    _state = 0"]
+
+    def emit_action(step, indent):
+        if step.function:
+            lines.append(" " * indent + step.function.replace(":=", "="))
+
+    emit_action(spec.steps[0], 4)
+    lines += ["    _visited = []", "    _extra = {}", "    for _inputs in _trace:", "        _extra.update(_inputs)"]
+    lines += [f"        {v} = _inputs.get({v!r}, {v})" for v in variables]
+    keyword = "if"
+    for step in spec.steps:
+        edges = by_src.get(step.name)
+        if not edges:
+            continue
+        lines.append(f"        {keyword} _state == {state_ids[step.name]}:")
+        for j, t in enumerate(edges):
+            lines.append(f"            {'if' if j == 0 else 'elif'} {t.guard}:")
+            lines.append(f"                _state = {state_ids[t.tgt]}")
+            emit_action(spec.steps[state_ids[t.tgt]], 16)
+        keyword = "elif"
+    lines += [
+        "        _visited.append(_state)",
+        "    _extra.update({" + ", ".join(f"{v!r}: {v}" for v in variables) + "})",
+        "    return _extra, tuple([_STATES[i] for i in _visited])",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def compile_fsm(spec):
+    """Returns run(trace), a function specialised to spec by code generation; same results as run_fsm."""
+    namespace = {"__builtins__": {"tuple": tuple}, "_STATES": encode(spec).states}
+    exec(compile(_codegen(spec), f"<fsm {spec.name}>", "exec"), namespace)
+    return namespace["run"]
+
+
+def run_batch(spec, traces):
+    """Runs spec over many traces with its specialised runner; returns one (variables, states) result per trace."""
+    run = compile_fsm(spec)
+    return [run(trace) for trace in traces]
+
+
+@lru_cache(maxsize=4096)
+def _run_frozen(name, frozen_trace):
+    return compile_fsm(get_example(name))([dict(inputs) for inputs in frozen_trace])
+
+
+def run_cached(name, trace):
+    """
+    Like run_fsm(get_example(name), trace), memoized per (name, trace contents) so harnesses that
+    replay a fixed trace corpus only simulate each pair once. Returns a fresh variables dict.
+    """
+    env, visited = _run_frozen(name, tuple(tuple(sorted(inputs.items())) for inputs in trace))
+    return dict(env), visited
+
+
+class _Lanewise(ast.NodeTransformer):
+    """Rewrites a scalar guard/assignment so it evaluates elementwise over NumPy arrays (one lane per trace)."""
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        values = [_truth_call(v) for v in node.values]
+        expr = values[0]
+        for v in values[1:]:
+            expr = ast.BinOp(expr, op, v)
+        return expr
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.UnaryOp(ast.Invert(), _truth_call(node.operand))
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+        # a < b < c -> (a < b) & (b < c)
+        pairs = [ast.Compare(left, [op], [right])
+                 for left, op, right in zip([node.left] + node.comparators[:-1], node.ops, node.comparators)]
+        expr = pairs[0]
+        for pair in pairs[1:]:
+            expr = ast.BinOp(expr, ast.BitAnd(), pair)
+        return expr
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        return ast.Call(ast.Name("_where", ast.Load()), [_truth_call(node.test), node.body, node.orelse], [])
+
+
+def _truth_call(node):
+    return ast.Call(ast.Name("_truth", ast.Load()), [node], [])
+
+
+_LANE_CODE_CACHE = {}
+
+
+def _lane_code(source, mode):
+    code = _LANE_CODE_CACHE.get((source, mode))
+    if code is None:
+        tree = ast.fix_missing_locations(_Lanewise().visit(ast.parse(source.replace(":=", "="), mode=mode)))
+        code = _LANE_CODE_CACHE[(source, mode)] = compile(tree, "<lanes>", mode)
+    return code
+
+
+def run_lanes(spec, inputs, n_cycles):
+    """
+    Runs N traces of spec at once, one NumPy lane per trace. inputs maps a variable to an array of
+    shape (n_cycles, N) holding its value in every cycle and lane. Same semantics as run_fsm per lane,
+    including ZeroDivisionError when an active lane divides by zero; returns (final {variable: array(N)},
+    int8 array (n_cycles, N) of active state ids, see encode()).
+    """
+    import numpy as np
+
+    lane_globals = {"__builtins__": {}, "_truth": lambda x: np.asarray(x) != 0, "_where": np.where}
+
+    def lane_envs(env, mask):
+        return ((k, {v: x[k].item() for v, x in env.items()}) for k in np.flatnonzero(mask).tolist())
+
+    def eval_guard(guard, env, mask):
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                return mask & (np.asarray(eval(_lane_code(guard, "eval"), lane_globals, env)) != 0)
+        except FloatingPointError:
+            # Some lane divides by zero, maybe one that is not in mask: evaluate the masked lanes one
+            # at a time as run_fsm does, so only a zero divisor in one of them raises.
+            fired = np.zeros_like(mask)
+            for k, lane_env in lane_envs(env, mask):
+                fired[k] = bool(guard_fn(guard)(lane_env))
+            return fired
+
+    def run_action(function, env, mask):
+        scratch = dict(env)
+        try:
+            with np.errstate(divide="raise", invalid="raise"):
+                exec(_lane_code(function, "exec"), lane_globals, scratch)
+        except FloatingPointError:
+            scratch = {v: np.array(x, dtype=np.result_type(x, np.int64)) for v, x in env.items()}
+            for k, lane_env in lane_envs(env, mask):
+                _apply_ops(action_ops(function), lane_env)
+                for v, x in lane_env.items():
+                    scratch[v][k] = x
+        for v in scratch:
+            if scratch[v] is not env.get(v):
+                env[v] = np.where(mask, scratch[v], env[v])
+
+    enc = encode(spec)
+    n = len(next(iter(inputs.values()))[0]) if inputs else 1
+    env = {v: np.zeros(n, dtype=np.int64) for v in spec.variables}
+    by_src = transitions_by_src(spec)
+    state_ids = {name: i for i, name in enumerate(enc.states)}
+    edges = [[(t.guard, state_ids[t.tgt]) for t in by_src.get(name, ())] for name in enc.states]
+    actions = [s.function or None for s in spec.steps]
+    state = np.zeros(n, dtype=np.int8)
+    if actions[0] is not None:
+        run_action(actions[0], env, np.ones(n, dtype=bool))
+    visited = np.empty((n_cycles, n), dtype=np.int8)
+    for cycle in range(n_cycles):
+        for v, values in inputs.items():
+            env[v] = np.asarray(values[cycle])
+        next_state = state.copy()
+        for s, out in enumerate(edges):
+            pending = state == s
+            for guard, tgt in out:
+                if not pending.any():
+                    break
+                fired = eval_guard(guard, env, pending)
+                pending &= ~fired
+                next_state[fired] = tgt
+                if actions[tgt] is not None and fired.any():
+                    run_action(actions[tgt], env, fired)
+        state = next_state
+        visited[cycle] = state
+    return env, visited
+
+if __name__ == "__main__":
+    # Print example names, as one write
+    sys.stdout.write(_banner())
@@ -1,3 +1,28 @@
+import sys
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+
+# Immutable tuple records mirroring one sfc_examples entry (see sfc_records below).
+class Step(NamedTuple):
+    name: str
+    function: str
+
+
+class Transition(NamedTuple):
+    src: str
+    tgt: str
+    guard: str
+
+
+class SFCExample(NamedTuple):
+    steps: tuple
+    transitions: tuple
+    variables: tuple
+
+
 sfc_examples = [
     # 1. Sum of first n natural numbers
     {
@@ -620,22 +645,8 @@ sfc_examples = [
         ],
         "variables": ["num", "s", "harshad", "n", "init"]
     },
-    # 39. Check palindrome for integer n (copy of #9, for completeness)
-    {
-        "steps": [
-            {"name": "Init", "function": "rev := 0; num := n; orig := n"},
-            {"name": "Check", "function": ""},
-            {"name": "Step", "function": "rev := rev*10 + num%10; num := num//10"},
-            {"name": "End", "function": ""}
-        ],
-        "transitions": [
-            {"src": "Init", "tgt": "Check", "guard": "init"},
-            {"src": "Check", "tgt": "Step", "guard": "num > 0"},
-            {"src": "Step", "tgt": "Check", "guard": "True"},
-            {"src": "Check", "tgt": "End", "guard": "num == 0"}
-        ],
-        "variables": ["rev", "num", "orig", "n", "init"]
-    },
+    # 39. Check palindrome for integer n (copy of #9, for completeness; filled in below)
+    None,
     # 40. Add two numbers
     {
         "steps": [
@@ -759,9 +770,163 @@ sfc_examples = [
     },
 ]
 
-# To print a sample as SFC code:
-for idx, sfc in enumerate(sfc_examples, 1):
-    print(f"# --- SFC Example {idx} ---")
-    print(f"steps = {sfc['steps']}")
-    print(f"transitions = {sfc['transitions']}")
-    print(f"variables = {sfc['variables']}\n")
+# #39 is #9 verbatim: share the one dict rather than building a second copy.
+sfc_examples[38] = sfc_examples[8]
+
+# Guards ("init", "True"), step names ("Check", "End") and variable names recur across examples;
+# interning them makes equal strings one object, so comparisons take the identity fast path.
+for _sfc in sfc_examples:
+    for _step in _sfc["steps"]:
+        _step["name"] = sys.intern(_step["name"])
+        _step["function"] = sys.intern(_step["function"])
+    for _t in _sfc["transitions"]:
+        _t["src"], _t["tgt"], _t["guard"] = sys.intern(_t["src"]), sys.intern(_t["tgt"]), sys.intern(_t["guard"])
+    _sfc["variables"][:] = map(sys.intern, _sfc["variables"])
+del _sfc, _step, _t
+
+# sfc_examples as records with attribute access (sfc_records[i].steps[0].name); SFC objects and
+# SFC files need the dict/list form, so sfc_examples itself stays as it is.
+sfc_records = [
+    SFCExample(
+        tuple(Step(**step) for step in sfc["steps"]),
+        tuple(Transition(**t) for t in sfc["transitions"]),
+        tuple(sfc["variables"]),
+    )
+    for sfc in sfc_examples
+]
+
+# Columnar (struct-of-arrays) views of sfc_examples, indexed like it (0-based). sfc_examples keeps
+# the dict/list shape that SFC objects and SFC files use; these are for scanning many examples, e.g.
+# TRANS[i]["src"] == "Check" is a boolean mask over example i's transitions.
+STEP_NAMES = [tuple(step["name"] for step in sfc["steps"]) for sfc in sfc_examples]
+STEP_FNS = [tuple(step["function"] for step in sfc["steps"]) for sfc in sfc_examples]
+_NAME_WIDTH = max(len(t[key]) for sfc in sfc_examples for t in sfc["transitions"] for key in ("src", "tgt"))
+_GUARD_WIDTH = max(len(t["guard"]) for sfc in sfc_examples for t in sfc["transitions"])
+TRANSITION_DTYPE = np.dtype([("src", f"U{_NAME_WIDTH}"), ("tgt", f"U{_NAME_WIDTH}"), ("guard", f"U{_GUARD_WIDTH}")])
+TRANS = [
+    np.array([(t["src"], t["tgt"], t["guard"]) for t in sfc["transitions"]], dtype=TRANSITION_DTYPE)
+    for sfc in sfc_examples
+]
+
+# Guards and step functions compiled once per distinct text, parallel to the transitions/steps of
+# each example: GUARD_CODES[i][j] is transition j's "eval" code, FN_CODES[i][j] step j's "exec" code
+# (":=" read as "="), or None for a step without a function.
+_CODE_CACHE = {}
+
+
+def _compiled(source, mode):
+    code = _CODE_CACHE.get((source, mode))
+    if code is None:
+        code = _CODE_CACHE[(source, mode)] = compile(source.replace(":=", "="), "<sfc>", mode)
+    return code
+
+
+GUARD_CODES = [tuple(_compiled(t["guard"] or "True", "eval") for t in sfc["transitions"]) for sfc in sfc_examples]
+FN_CODES = [
+    tuple(_compiled(step["function"], "exec") if step["function"] else None for step in sfc["steps"])
+    for sfc in sfc_examples
+]
+
+# Outgoing transitions per step, in declaration (= priority) order. TRANS_BY_SRC[i][name] holds the
+# transition dicts of example i leaving step `name`; EDGES[i][k] holds the same for the k-th step as
+# (transition index, target step index) pairs, so a runner needs no string hashing per step.
+STATE_IDS = [{name: k for k, name in enumerate(names)} for names in STEP_NAMES]
+# Position of each variable in example i's variables list, i.e. in the tuple compile_example(i) returns.
+VAR_INDEX = [{name: k for k, name in enumerate(sfc["variables"])} for sfc in sfc_examples]
+TRANS_BY_SRC = []
+EDGES = []
+for _sfc, _ids in zip(sfc_examples, STATE_IDS):
+    _by_src = {name: [] for name in _ids}
+    _edges = [[] for _ in _ids]
+    for _j, _t in enumerate(_sfc["transitions"]):
+        _by_src[_t["src"]].append(_t)
+        _edges[_ids[_t["src"]]].append((_j, _ids[_t["tgt"]]))
+    TRANS_BY_SRC.append({name: tuple(ts) for name, ts in _by_src.items()})
+    EDGES.append(tuple(map(tuple, _edges)))
+del _sfc, _ids, _by_src, _edges, _j, _t
+
+
+def is_straight_line(i):
+    """True for constant-time examples (#26-#32, #35-#36, #40-#50): Init's only transition leads to a final step."""
+    edges = EDGES[i]
+    return len(sfc_examples[i]["transitions"]) == 1 and len(edges[0]) == 1 and not edges[edges[0][0][1]]
+
+
+def _codegen(i):
+    """Python source of run(**variables) for example i with its transition graph inlined (see compile_example)."""
+    sfc = sfc_examples[i]
+    variables = sfc["variables"]
+    params = ", ".join(f"{v}=1" if v == "init" else f"{v}=0" for v in variables)
+    # Internal names start with "_" so they never collide with SFC variables.
+    lines = [f"def run({params}, _max_steps=1000000):"]
+    if sfc["steps"][0]["function"]:
+        lines.append("    " + sfc["steps"][0]["function"].replace(":=", "="))
+    returns = f"    return ({', '.join(variables)},)"
+    if is_straight_line(i):
+        # Init computes the result and a single transition leads to a final step: no loop needed.
+        t = sfc["transitions"][0]
+        end_fn = sfc["steps"][EDGES[i][0][0][1]]["function"]
+        if end_fn:
+            lines += [f"    if {t['guard'] or 'True'}:", "        " + end_fn.replace(":=", "=")]
+        return "\n".join(lines + [returns]) + "\n"
+    lines += ["    _state = 0", "    for _ in range(_max_steps):"]
+    for k, edges in enumerate(EDGES[i]):
+        if not edges:
+            continue
+        lines.append(f"        if _state == {k}:")
+        for j, tgt in edges:
+            guard = sfc["transitions"][j]["guard"] or "True"
+            # An always-true guard fires unconditionally; later edges of the step are unreachable.
+            indent = " " * (12 if guard == "True" else 16)
+            if guard != "True":
+                lines.append(f"            if {guard}:")
+            lines.append(f"{indent}_state = {tgt}")
+            if sfc["steps"][tgt]["function"]:
+                lines.append(indent + sfc["steps"][tgt]["function"].replace(":=", "="))
+            lines.append(f"{indent}continue")
+            if guard == "True":
+                break
+        else:
+            lines.append("            break")
+    # Steps without outgoing transitions end the run.
+    lines += [
+        "        break",
+        "    else:",
+        "        raise RuntimeError(f'no final step reached in {_max_steps} transitions')",
+        returns,
+    ]
+    return "\n".join(lines) + "\n"
+
+
+@lru_cache(maxsize=None)
+def compile_example(i):
+    """
+    Returns run(**variables) for example i (0-based, like sfc_examples): a function generated from
+    the example with its steps and guards inlined. Variables default to 0 (init to 1); the initial
+    step's function runs first, then the first enabled transition of the active step fires and its
+    target's function runs, until the active step has no enabled transition. Returns the final
+    values as a tuple in variables order (see VAR_INDEX), so batch callers build no dicts.
+    """
+    namespace = {"__builtins__": {"range": range, "RuntimeError": RuntimeError}}
+    exec(compile(_codegen(i), f"<sfc example {i + 1}>", "exec"), namespace)
+    return namespace["run"]
+
+
+def run_example(i, /, **inputs):
+    """
+    Runs example i (0-based) on the given input variables; returns the final {variable: value}.
+    i is positional-only, so examples with a variable named i take it as an input.
+    """
+    return dict(zip(sfc_examples[i]["variables"], compile_example(i)(**inputs)))
+
+
+if __name__ == "__main__":
+    # Print every example as SFC code (the steps/transitions/variables format SFC files use),
+    # in a single write; importing the module prints nothing.
+    sys.stdout.write("".join(
+        f"# --- SFC Example {idx} ---\n"
+        f"steps = {sfc['steps']}\n"
+        f"transitions = {sfc['transitions']}\n"
+        f"variables = {sfc['variables']}\n\n"
+        for idx, sfc in enumerate(sfc_examples, 1)
+    ))
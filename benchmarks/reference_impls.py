@@ -0,0 +1,333 @@
+"""
+Fast reference implementations of the SFC examples in Benchmarks.py.
+
+Each SFC example computes its result by stepping a state machine one scan cycle at a time; the
+functions here compute the same value directly (closed forms, or better algorithms), so benchmark
+drivers can check an SFC run against them and time the algorithmic optimum next to it.
+
+REFERENCES maps the 1-based example number to (result variable, function). The function takes the
+example's input variables as keyword arguments, e.g. REFERENCES[1][1](n=10) == 55, and matches the
+SFC's result on the inputs the example is meant for (non-negative n unless noted).
+
+All references are plain Python, so results use arbitrary-precision ints on every install.
+"""
+import inspect
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# --- Arithmetic loops with closed forms (examples 1, 13, 14, 15, 19, 20, 23, 24, 33, 34) ---
+
+def sum_n(n):
+    """1 + 2 + ... + n (example 1; also the triangular number of example 23)."""
+    return n * (n + 1) // 2 if n > 0 else 0
+
+
+def factorial(n):
+    """n! (examples 13 and 14); 1 for n <= 0, like the SFC."""
+    return math.factorial(n) if n > 0 else 1
+
+
+def sum_squares(n):
+    """1^2 + ... + n^2 (example 19)."""
+    return n * (n + 1) * (2 * n + 1) // 6 if n > 0 else 0
+
+
+def sum_cubes(n):
+    """1^3 + ... + n^3 (example 20)."""
+    return sum_n(n) ** 2
+
+
+def pentagonal(n):
+    """n-th pentagonal number (example 24)."""
+    return n * (3 * n - 1) // 2 if n > 0 else 0
+
+
+def sum_odd(n):
+    """Sum of the odd numbers up to n (example 33): the first k odd numbers sum to k^2."""
+    k = (n + 1) // 2 if n > 0 else 0
+    return k * k
+
+
+def sum_even(n):
+    """Sum of the even numbers up to n (example 34): the first k even numbers sum to k(k + 1)."""
+    k = n // 2 if n > 0 else 0
+    return k * (k + 1)
+
+
+def factorial_trailing_zeros(n):
+    """Trailing zeros of n! by Legendre's formula, sum of n // 5^k (example 15)."""
+    count = 0
+    power = 5
+    while power <= n:
+        count += n // power
+        power *= 5
+    return count
+
+
+# --- Order-2 linear recurrences in O(log n) (examples 2 and 25) ---
+
+def fibonacci(n):
+    """F(n) by fast doubling, iterative over the bits of n (example 2; the SFC yields F(1) = 1 for n <= 1)."""
+    n = max(n, 1)
+    a, b = 0, 1  # F(k), F(k + 1) for k = the bits of n read so far
+    for bit in bin(n)[2:]:
+        a, b = a * (2 * b - a), a * a + b * b  # F(2k), F(2k + 1)
+        if bit == "1":
+            a, b = b, a + b
+    return a
+
+
+def _mat_mul(x, y):
+    (a, b), (c, d) = x
+    (e, f), (g, h) = y
+    return (a * e + b * g, a * f + b * h), (c * e + d * g, c * f + d * h)
+
+
+def pell(n):
+    """P(n), the top-left entry of [[2, 1], [1, 0]]^(n - 1), by repeated squaring (example 25; P(1) for n <= 1)."""
+    k = max(n, 1) - 1
+    result, base = ((1, 0), (0, 1)), ((2, 1), (1, 0))
+    while k:
+        if k & 1:
+            result = _mat_mul(result, base)
+        base = _mat_mul(base, base)
+        k >>= 1
+    return result[0][0]
+
+
+# --- Decimal digits (examples 5, 6, 8, 9, 38, 39) ---
+# CPython converts an int to its decimal string in one C call; walking the string beats a
+# % 10 / // 10 loop, which allocates two ints per digit.
+
+def reverse_digits(n):
+    """n with its decimal digits reversed (examples 5, 9 and 39; 120 -> 21); 0 for n <= 0."""
+    return int(str(n)[::-1]) if n > 0 else 0
+
+
+def is_palindrome(n):
+    """True if n reads the same reversed, i.e. examples 9/39 end with rev == orig."""
+    return reverse_digits(n) == n
+
+
+def count_digits(n):
+    """Number of decimal digits of n (example 6); 0 for n <= 0."""
+    return len(str(n)) if n > 0 else 0
+
+
+def digit_sum(n):
+    """Sum of the decimal digits of n (example 8); 0 for n <= 0."""
+    return sum(map(int, str(n))) if n > 0 else 0
+
+
+def digit_sum_swar(n):
+    """
+    digit_sum() eight digits at a time: the ASCII digits are packed into a 64-bit word, "0"
+    (0x30) is subtracted from every byte at once, and multiplying by 0x0101010101010101 adds
+    all bytes into the top one (at most 8 * 9 = 72, so no carries leak between bytes).
+    """
+    digits = str(n).encode() if n > 0 else b""
+    total = 0
+    for start in range(0, len(digits), 8):
+        word = int.from_bytes(digits[start:start + 8].rjust(8, b"0"), "little") - 0x3030303030303030
+        total += ((word * 0x0101010101010101) & 0xFFFFFFFFFFFFFFFF) >> 56
+    return total
+
+
+def is_harshad(n):
+    """True if n is divisible by its digit sum (example 38; for n >= 1)."""
+    return n % digit_sum(n) == 0
+
+
+# --- Bit-level integer functions (examples 16 and 17) ---
+
+def integer_sqrt(n):
+    """floor(sqrt(n)) via math.isqrt (Newton's method in C) instead of subtracting odd numbers; 0 for n < 0."""
+    return math.isqrt(n) if n > 0 else 0
+
+
+def ilog2(n):
+    """floor(log2(n)) as n.bit_length() - 1, one C call instead of halving in a loop; 0 for n <= 1."""
+    return n.bit_length() - 1 if n > 1 else 0
+
+
+# --- GCD / LCM (examples 3, 4 and 18) ---
+# math.gcd (C, Lehmer's algorithm) is the default reference; the subtraction SFC needs up to
+# max(a, b) / min(a, b) steps, e.g. a billion for a = 10**9, b = 1.
+
+def gcd_binary(a, b):
+    """Stein's binary GCD, shifts and subtractions only (a, b >= 0)."""
+    if a == 0 or b == 0:
+        return a | b
+    shift = 0
+    while ((a | b) & 1) == 0:
+        a >>= 1
+        b >>= 1
+        shift += 1
+    while (a & 1) == 0:
+        a >>= 1
+    while b:
+        while (b & 1) == 0:
+            b >>= 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+def gcd(a, b):
+    """Greatest common divisor (examples 3 and 18, for a, b >= 1)."""
+    return math.gcd(a, b)
+
+
+def lcm(a, b):
+    """Least common multiple (example 4, for a, b >= 1)."""
+    return a * b // math.gcd(a, b)
+
+
+# --- Primality (examples 11 and 12) ---
+
+# Candidates coprime to 30 in the first turn of the 2-3-5 wheel (7..31); later turns add 30.
+_WHEEL_30 = (7, 11, 13, 17, 19, 23, 29, 31)
+
+
+def is_prime(n):
+    """Trial division by 2, 3, 5 and then only numbers coprime to 30 (example 11; for n >= 2)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5):
+        if n % p == 0:
+            return n == p
+    base = 0
+    while True:
+        for d in _WHEEL_30:
+            i = base + d
+            if i * i > n:
+                return True
+            if n % i == 0:
+                return False
+        base += 30
+
+
+def next_prime(n):
+    """Smallest prime greater than n (example 12; for n >= 1)."""
+    num = n + 1
+    while not is_prime(num):
+        num += 1
+    return num
+
+
+def prime_flags(limit):
+    """Sieve of Eratosthenes: a bool array whose entry k says whether k is prime, for 0 <= k <= limit."""
+    flags = np.ones(max(limit, 1) + 1, dtype=bool)
+    flags[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = False
+    return flags[:limit + 1]
+
+
+# --- Divisor sums (example 37) ---
+
+def proper_divisor_sum(n):
+    """Sum of the divisors of n below n, pairing i with n // i up to sqrt(n) (example 37's sum)."""
+    if n < 2:
+        return 0
+    total = 1
+    i = 2
+    while i * i <= n:
+        if n % i == 0:
+            j = n // i
+            total += i + j if j != i else i
+        i += 1
+    return total
+
+
+def is_perfect(n):
+    """True if n equals the sum of its proper divisors."""
+    return n > 1 and proper_divisor_sum(n) == n
+
+
+# --- Constant-time examples (26-32, 35, 36, 40-46, 48-50) ---
+# These SFCs are a single Init -> End step; the references are the expression itself.
+
+def is_leap_year(n):
+    """Gregorian leap year test (example 28)."""
+    return n % 4 == 0 and n % 100 != 0 or n % 400 == 0
+
+
+REFERENCES = {
+    1: ("sum", sum_n),
+    2: ("b", fibonacci),
+    3: ("x", gcd),
+    4: ("lcm", lcm),
+    5: ("rev", reverse_digits),
+    6: ("count", count_digits),
+    8: ("s", digit_sum),
+    9: ("rev", reverse_digits),
+    11: ("is_prime", is_prime),
+    12: ("num", next_prime),
+    13: ("fact", factorial),
+    14: ("prod", factorial),
+    15: ("cnt", factorial_trailing_zeros),
+    # The SFC subtracts 1, 3, 5, ... and stops with the next odd number, 2 * isqrt(n) + 1, in i.
+    16: ("i", lambda n: 2 * integer_sqrt(n) + 1),
+    17: ("cnt", ilog2),
+    18: ("x", gcd),
+    19: ("sum", sum_squares),
+    20: ("sum", sum_cubes),
+    23: ("tri", sum_n),
+    24: ("pent", pentagonal),
+    25: ("b", pell),
+    26: ("even", lambda n: n % 2 == 0),
+    27: ("odd", lambda n: n % 2 != 0),
+    28: ("leap", is_leap_year),
+    29: ("div3", lambda n: n % 3 == 0),
+    30: ("div5", lambda n: n % 5 == 0),
+    31: ("next_even", lambda n: (n | 1) + 1),
+    32: ("next_odd", lambda n: (n + 1) | 1),
+    33: ("sum", sum_odd),
+    34: ("sum", sum_even),
+    35: ("doubled", lambda n: n << 1),
+    36: ("halved", lambda n: n >> 1),
+    37: ("sum", proper_divisor_sum),
+    38: ("harshad", is_harshad),
+    39: ("rev", reverse_digits),
+    40: ("sum", lambda a, b: a + b),
+    41: ("diff", lambda a, b: a - b),
+    42: ("prod", lambda a, b: a * b),
+    43: ("quot", lambda a, b: a // b),
+    44: ("rem", lambda a, b: a % b),
+    45: ("mx", lambda a, b: a if a > b else b),
+    46: ("mn", lambda a, b: a if a < b else b),
+    48: ("f", lambda c: c * 9 / 5 + 32),
+    49: ("c", lambda f: (f - 32) * 5 / 9),
+    50: ("absn", lambda n: abs(n)),
+}
+
+
+def reference_inputs(example):
+    """The input variables an example's reference takes, e.g. ("n",) or ("a", "b")."""
+    return tuple(inspect.signature(REFERENCES[example][1]).parameters)
+
+
+def _column(example, ns):
+    fn = REFERENCES[example][1]
+    return [fn(n=int(n)) for n in ns]
+
+
+def run_references(ns, examples=None, max_workers=None):
+    """
+    Evaluates the references of examples (default: every one whose only input is n) for every n in ns. Returns
+    {example: [result per n]}. Examples are independent, so with max_workers > 1 each one's
+    column is computed in its own worker process.
+    """
+    if examples is None:
+        examples = [example for example in sorted(REFERENCES) if reference_inputs(example) == ("n",)]
+    examples = list(examples)
+    ns = list(ns)
+    if max_workers is None or max_workers <= 1:
+        return {example: _column(example, ns) for example in examples}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(examples, pool.map(_column, examples, [ns] * len(examples))))
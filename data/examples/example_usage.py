@@ -15,6 +15,7 @@ Prerequisites:
 
 import sys
 import os
+import numpy as np
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from benchmarks.Benchmarks import sfc_examples
@@ -49,6 +50,16 @@ def create_factorial_sfc():
     return sfc
 
 
+def _compile(example):
+    """Struct-of-arrays view of a benchmark example: step names and int32 src/tgt step ids"""
+    step_names = [step["name"] for step in example["steps"]]
+    name2id = {name: i for i, name in enumerate(step_names)}
+    transitions = example["transitions"]
+    src = np.fromiter((name2id[t["src"]] for t in transitions), np.int32, len(transitions))
+    tgt = np.fromiter((name2id[t["tgt"]] for t in transitions), np.int32, len(transitions))
+    return step_names, src, tgt
+
+
 def demonstrate_sfc_analysis():
     """Demonstrate SFC analysis and visualization"""
     print("=== Containment Checker Demo ===\n")
@@ -98,11 +109,20 @@ def demonstrate_benchmark_examples():
     """Demonstrate using benchmark examples"""
     print("\n=== Benchmark Examples ===\n")
 
-    print("Available benchmark examples:")
+    # The SoA kernels are cheap enough to sweep every benchmark example in one pass
+    verifier = Verifier()
+    all_cut_points = []
+    for example in sfc_examples:
+        step_names, src, tgt = _compile(example)
+        pn_soa = verifier.sfc_to_petrinet_soa(src, tgt, len(step_names))
+        all_cut_points.append([step_names[i] for i in verifier.find_cut_points_soa(pn_soa)])
+
+    print(f"Available benchmark examples ({len(sfc_examples)} analysed):")
     for i, example in enumerate(sfc_examples[:5]):  # Show first 5 examples
         print(
             f"  {i+1}. {len(example['steps'])} steps, {len(example['variables'])} variables")
         print(f"     Variables: {example['variables']}")
+        print(f"     Cut points: {all_cut_points[i]}")
 
     # Use the first example (sum of natural numbers)
     print(f"\nAnalyzing example 1: Sum of first n natural numbers")
@@ -118,11 +138,17 @@ def demonstrate_benchmark_examples():
     print(f"Initial step: {sfc.initial_step}")
 
     # Convert to Petri net and analyze
-    verifier = Verifier()
     pn = verifier.sfc_to_petrinet(sfc)
     cut_points = verifier.find_cut_points(pn)
     print(f"Cut points: {cut_points}")
 
+    # Same analysis on the struct-of-arrays form (steps as int ids, initial step = id 0)
+    step_names, src, tgt = _compile(example)
+    pn_soa = verifier.sfc_to_petrinet_soa(src, tgt, len(step_names))
+    cut_ids = verifier.find_cut_points_soa(pn_soa)
+    print(f"Cut points (SoA): {[step_names[i] for i in cut_ids]}")
+    print(f"Cut points per example (all {len(sfc_examples)}): {[len(c) for c in all_cut_points]}")
+
 
 def main():
     """Main demo function"""
@@ -11,27 +11,30 @@ Antarbhukti — Streamlit UI (Batch Processing Enabled)
 
 import streamlit as st
 import os
-import subprocess
-import datetime
-import shutil
-import re
-import glob
+import functools
 import time
-import unicodedata
+from collections import deque
 import json
 import pandas as pd # Required for CSV display
+# subprocess, shutil and glob are imported where they are used: only the run path needs them,
+# and every widget interaction re-executes this module.
 
 # ---------------------------
 # Config loader
 # ---------------------------
+@st.cache_data(show_spinner=False)
+def _read_config(cfg_path, mtime):
+    # mtime is only part of the cache key: editing config.json invalidates the cached parse.
+    with open(cfg_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_config():
     app_dir = os.path.dirname(os.path.abspath(__file__))
     cfg_path = os.path.join(app_dir, "src", "antarbhukti", "config.json")
     if not os.path.exists(cfg_path):
         st.error(f"Config file missing: {cfg_path}")
         st.stop()
-    with open(cfg_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _read_config(cfg_path, os.path.getmtime(cfg_path))
 
 # ---------------------------
 # Page settings
@@ -115,83 +118,144 @@ with tab1:
 # ---------------------------
 # Logging helper (minimal)
 # ---------------------------
-def add_log_text(logs, msg, panel):
-    logs += f"[{datetime.datetime.now().isoformat()}] {msg}\n"
-    panel.text_area("Logs", logs, height=360)
-    return logs
+LOG_MAX_LINES = 2000
+LOG_FLUSH_INTERVAL = 0.1  # seconds between re-renders of the log panel
 
-# ---------------------------
-# Text sanitizer
-# ---------------------------
-def sanitize_text(s: str) -> str:
-    if s is None:
-        return ""
-    s = unicodedata.normalize("NFKC", s)
-    s = s.replace("→", "->").replace("←", "<-").replace("⇒", "=>").replace("⇐", "<=")
-    return "".join(ch for ch in s if ch == "\n" or ch == "\t" or (31 < ord(ch) < 0x10FFFF))
+_last_ts = [0, ""]
+
+def _ts():
+    # Log prefixes only need second resolution; format once per second instead of once per line.
+    sec = int(time.time())
+    if sec != _last_ts[0]:
+        _last_ts[0], _last_ts[1] = sec, time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_ts[1]
+
+def flush_log(log_buf, panel, log_state):
+    # log_state = [last render time, unrendered lines pending]; re-rendering identical text is skipped.
+    if log_state[1]:
+        panel.text_area("Logs", "\n".join(log_buf), height=360)
+        log_state[:] = [time.monotonic(), False]
+
+def add_log_text(log_buf, msg, panel, log_state):
+    # Re-sending the whole panel per line is O(output) each time; keep recent lines and render at most every interval.
+    log_buf.append(f"[{_ts()}] {msg}")
+    log_state[1] = True
+    if time.monotonic() - log_state[0] >= LOG_FLUSH_INTERVAL:
+        flush_log(log_buf, panel, log_state)
 
 # ---------------------------
 # Extractor (clean)
 # ---------------------------
-def extract_blocks(full_output: str):
-    out = sanitize_text(full_output or "")
-    blocks = []
-
-    # fenced blocks
-    fenced = re.findall(r"```(?:\w*\n)?([\s\S]*?)```", out)
-    blocks.extend([b.strip() for b in fenced if b.strip()])
-
-    # indented 4-space blocks
-    for m in re.finditer(r"(?:^|\n)((?: {4}.+(?:\n|$))+)", out):
-        block = m.group(1)
-        cleaned = "\n".join([ln[4:] if ln.startswith("    ") else ln for ln in block.splitlines()])
-        if cleaned.strip():
-            blocks.append(cleaned.strip())
-
-    # SFC-structured blocks
-    sfc_parts = []
-    steps_match = re.search(r"(steps\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
-    if steps_match:
-        sfc_parts.append(steps_match.group(1).strip())
-        transitions_match = re.search(r"(transitions\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
-        if transitions_match:
-            sfc_parts.append(transitions_match.group(1).strip())
-        variables_match = re.search(r"(variables\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
-        if variables_match:
-            sfc_parts.append(variables_match.group(1).strip())
-        init_match = re.search(r"(initial_step\s*=\s*['\"].+?['\"])", out, flags=re.IGNORECASE)
-        if init_match:
-            sfc_parts.append(init_match.group(1).strip())
-
-    if sfc_parts:
-        combined = "\n\n".join(sfc_parts)
-        blocks.insert(0, combined)
-
-    # PLC heuristic (fallback)
-    plc_keywords = ["STEP", "STATE", "TRANSITION", "IF", "THEN", "ELSE", ":=", "="]
-    plc_lines = [ln for ln in out.splitlines() if any(k in ln for k in plc_keywords)]
-    if len(plc_lines) >= 3 and not blocks:
-        blocks.append("\n".join(plc_lines))
-
-    return blocks
+# Kept outside this module, which Streamlit re-executes on every interaction, so it can be imported and tested.
+from src.antarbhukti.blockextract import IncrementalSFCExtractor, sanitize_text
 
 # ---------------------------
 # Filesystem probe
 # ---------------------------
+EXTRA_SEARCH_ROOTS_ENV = "ANTARBHUKTI_EXTRA_SEARCH_ROOTS"
+
+@functools.lru_cache(maxsize=8)
+def _expand_extra_roots(spec):
+    # Entries may hold wildcards (e.g. /mnt/c/Users/*/OneDrive*); expand them once per distinct setting.
+    import glob
+    roots = []
+    for r in spec.split(os.pathsep):
+        r = os.path.abspath(os.path.expanduser(r.strip())) if r.strip() else ""
+        if not r:
+            continue
+        roots.extend(sorted(p for p in glob.glob(r) if os.path.isdir(p)) if glob.has_magic(r) else [r])
+    return tuple(roots)
+
+def artifact_search_roots(repo_root):
+    """
+    outputs/ and the legacy output/ under repo_root, repo_root itself, then any roots listed
+    (os.pathsep-separated) in $ANTARBHUKTI_EXTRA_SEARCH_ROOTS.
+    """
+    repo_root = os.path.abspath(repo_root)
+    defaults = (os.path.join(repo_root, "outputs"), os.path.join(repo_root, "output"), repo_root)
+    return defaults + _expand_extra_roots(os.environ.get(EXTRA_SEARCH_ROOTS_ENV, ""))
+
+def _artifact_rank(root_index, rel_path):
+    # outputs/**/success/** first, then output/**/success/**, then anything else under the repo root
+    # (the rest of outputs/ and output/ included), then the extra roots in listed order.
+    if root_index < 2 and "success" not in rel_path.split(os.sep)[:-1]:
+        return 2
+    return root_index
+
+def _scan_files(root, skip=()):
+    """
+    Yields (DirEntry, mtime) for every file under root; hidden dirs are skipped, as glob's ** does,
+    and so are the directories in skip (roots already walked).
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.path not in skip:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry, entry.stat().st_mtime
+                except OSError:
+                    continue
+
 def find_saved_file_by_basename(basename, repo_root, min_mtime=0.0):
-    patterns = [
-        os.path.join(repo_root, "outputs", "**", "success", "**", basename),
-        os.path.join(repo_root, "output", "**", "success", "**", basename),
-        os.path.join(repo_root, "**", basename),
-    ]
-    for pat in patterns:
-        for match in glob.glob(pat, recursive=True):
-            try:
-                if os.path.isfile(match) and os.path.getmtime(match) + 1e-6 >= min_mtime:
-                    return os.path.abspath(match)
-            except Exception:
+    """Best-ranked file named basename under the search roots, modified at or after min_mtime."""
+    # Not cached: the lookup runs right after the driver writes the file, and seeing a new file takes
+    # a full walk anyway. Directories are not pruned by their own mtime either: rewriting
+    # outputs/<llm>/success/x.txt leaves outputs/ and outputs/<llm>/ untouched.
+    best = None
+    walked = set()
+    for root_index, root in enumerate(artifact_search_roots(repo_root)):
+        if root in walked:
+            continue
+        for entry, mtime in _scan_files(root, walked):
+            if entry.name != basename or mtime + 1e-6 < min_mtime:
                 continue
-    return None
+            rank = _artifact_rank(root_index, os.path.relpath(entry.path, root))
+            if best is None or rank < best[0]:
+                best = (rank, os.path.abspath(entry.path))
+        walked.add(root)
+    return best[1] if best else None
+
+# ---------------------------
+# Process output reader
+# ---------------------------
+def iter_process_lines(process, on_idle, idle_timeout=LOG_FLUSH_INTERVAL):
+    """
+    Yields decoded lines from process.stdout (a binary pipe) as they arrive.
+    While the driver is silent (e.g. waiting on an LLM call), on_idle() is called every idle_timeout
+    seconds so throttled log lines still reach the screen.
+    """
+    import codecs
+    import io
+    import selectors
+    if os.name == "nt":  # selectors cannot wait on pipes on Windows
+        yield from io.TextIOWrapper(process.stdout, encoding="utf-8", errors="replace")
+        return
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    fd, pending = process.stdout.fileno(), ""
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            if not sel.select(idle_timeout):
+                on_idle()
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
 
 # ---------------------------
 # Run tab: execute driver (Batch support)
@@ -201,6 +265,9 @@ with tab2:
     run_button = st.button("Start Batch Verification", type="primary")
     
     if run_button:
+        import shutil
+        import subprocess
+
         # 1. Collect Valid Pairs
         valid_pairs = []
         for index, pair in enumerate(st.session_state.file_pairs):
@@ -228,6 +295,9 @@ with tab2:
             csv_filename = f"batch_report_{timestamp}.csv"
             session_csv_path = os.path.abspath(os.path.join(result_root, csv_filename))
             st.session_state.current_batch_csv = session_csv_path
+            # Full driver transcript for the batch; the on-screen log only keeps the last LOG_MAX_LINES lines.
+            result_txt_path = os.path.join(result_root, "result.txt")
+            open(result_txt_path, "w", encoding="utf-8").close()
             
             # 3. Process Pairs Sequentially
             progress_bar = st.progress(0)
@@ -248,7 +318,7 @@ with tab2:
                 with st.expander(f"Processing Pair {task['index']}: {task['new_file'].name}", expanded=True):
                     status_panel = st.empty()
                     log_panel = st.empty()
-                    logs = ""
+                    log_buf, log_state = deque(maxlen=LOG_MAX_LINES), [0.0, False]
                     
                     status_panel.info(f"Running verification for {task['new_file'].name}...")
                     run_start = time.time()
@@ -282,18 +352,22 @@ with tab2:
                         process = subprocess.Popen(
                             cmd, 
                             stdout=subprocess.PIPE, 
-                            stderr=subprocess.STDOUT, 
-                            text=True, 
-                            bufsize=1,
+                            stderr=subprocess.STDOUT,  # one pipe: stderr can never fill up unread while stdout is drained
+                            bufsize=65536,  # read in 64 KiB chunks; lines still arrive as the driver flushes (-u)
                             env=env_vars  # Pass the modified environment
                         )
                         
-                        full_stdout = ""
-                        for line in process.stdout:
-                            full_stdout += line
-                            logs = add_log_text(logs, line.rstrip(), log_panel)
+                        # Blocks are extracted as lines arrive, so the full output is never held in memory.
+                        extractor = IncrementalSFCExtractor()
+                        with open(result_txt_path, "a", encoding="utf-8", errors="replace", buffering=65536) as result_txt:
+                            result_txt.write(f"===== Pair {task['index']}: {task['new_file'].name} =====\n")
+                            for line in iter_process_lines(process, lambda: flush_log(log_buf, log_panel, log_state)):
+                                result_txt.write(line)
+                                # feed() returns the sanitized line; the log shows that same text instead of re-cleaning it.
+                                add_log_text(log_buf, extractor.feed(line).rstrip(), log_panel, log_state)
                         
                         retcode = process.wait()
+                        flush_log(log_buf, log_panel, log_state)
                         
                         if retcode == 0:
                             status_panel.success(f"Finished: {task['new_file'].name}")
@@ -301,13 +375,14 @@ with tab2:
                             status_panel.error(f"Failed: {task['new_file'].name}")
                             
                         # Extract result
-                        blocks = extract_blocks(full_stdout)
+                        blocks = extractor.finalize()
                         if not blocks:
                             saved_path = find_saved_file_by_basename(os.path.basename(task['new_file'].name), os.getcwd(), min_mtime=run_start)
                             if saved_path:
                                 with open(saved_path, "r", encoding="utf-8", errors="replace") as fh:
                                     blocks = [sanitize_text(fh.read())]
-                                    logs = add_log_text(logs, f"Found file: {saved_path}", log_panel)
+                                    add_log_text(log_buf, f"Found file: {saved_path}", log_panel, log_state)
+                                    flush_log(log_buf, log_panel, log_state)
 
                         if blocks:
                             st.subheader("Corrected Code Preview")
@@ -377,6 +452,10 @@ Antarbhukti is an LLM-driven PLC upgrade verification framework.
 
 Notes:
 - Batch Mode enabled: Upload pairs in Tab 1.
-- Results are saved in `outputs/`.
+- Results are saved in `outputs/`; the full driver output of the last batch is in `outputs/result.txt`.
+- When no corrected code appears in the driver output, the app looks for the saved file under `outputs/` only.
+  To search other folders as well (e.g. a synced Windows folder under WSL), set
+  `ANTARBHUKTI_EXTRA_SEARCH_ROOTS` to a list of directories separated by `:` (`;` on Windows).
+  Entries may use `*`/`?` wildcards (e.g. `/mnt/c/Users/*/OneDrive*`); they are expanded once per app process.
 - CSV Reports are generated per-batch in the Output tab.
 """)
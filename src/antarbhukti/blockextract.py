@@ -0,0 +1,168 @@
+"""
+Code-block extraction from the driver's output, shared by the Streamlit UI and its tests.
+
+extract_blocks() returns, in order: the combined SFC assignments (steps/transitions/variables/
+initial_step, only when a steps list exists), every ``` fenced block, every 4-space-indented
+block, and keyword-matching PLC lines only when nothing else was found.
+IncrementalSFCExtractor gives the same result line by line, while the driver is still running.
+"""
+
+import re
+import unicodedata
+
+# One translate table: ASCII arrows, and drop control characters other than \n and \t.
+_SANITIZE_TABLE = {i: None for i in range(32) if i not in (9, 10)}
+_SANITIZE_TABLE.update({0x10FFFF: None, ord("→"): "->", ord("←"): "<-", ord("⇒"): "=>", ord("⇐"): "<="})
+
+
+def sanitize_text(s: str) -> str:
+    if s is None:
+        return ""
+    return unicodedata.normalize("NFKC", s).translate(_SANITIZE_TABLE)
+
+
+_SFC_PARTS = ("steps", "transitions", "variables", "initial_step")
+# Each part is searched for on its own, like the regexes this replaces: lists up to their first ']',
+# initial_step up to its closing quote. The assignment may span lines ("steps =\n[...]").
+_SFC_START_RE = {
+    name: re.compile(name + r"\s*=\s*\[", re.IGNORECASE) for name in _SFC_PARTS[:3]
+}
+_SFC_START_RE["initial_step"] = re.compile(r"initial_step\s*=\s*['\"].+?['\"]", re.IGNORECASE)
+# An assignment that may still complete on a later line: the name, optionally its '=', then only whitespace.
+_SFC_TAIL_RE = {name: re.compile(name + r"\s*(?:=\s*)?\Z", re.IGNORECASE) for name in _SFC_PARTS}
+_SFC_NAME_RE = re.compile("|".join(_SFC_PARTS), re.IGNORECASE)
+_FENCE = "```"
+_FENCE_TAG_RE = re.compile(r"\w*")
+# Longer keywords first; only whether a line matches is used, so the order never changes the result.
+_PLC_KEYWORDS_RE = re.compile(r"TRANSITION|STATE|STEP|THEN|ELSE|IF|:=|=")
+
+
+class IncrementalSFCExtractor:
+    """
+    Line-at-a-time extractor, fed while the driver is still running so the full output never has to be kept.
+    finalize() returns the same blocks as extract_blocks() on the whole output.
+    """
+
+    def __init__(self):
+        self.sfc = {}          # first assignment found for each of _SFC_PARTS
+        self.fenced = []
+        self.indented = []
+        self.plc_lines = []    # fallback candidates, only collected while no block has been found
+        self._fence = None     # pieces of the currently open fence
+        self._indent = []      # current run of indented lines
+        self._pending = {}     # part -> text that may still become its assignment
+        self._open_list = {}   # part -> pieces of a list still waiting for its ']'
+
+    def feed(self, line):
+        """Consumes one line of driver output and returns it sanitized."""
+        line = sanitize_text(line).rstrip("\n")
+        self._feed_clean(line)
+        return line
+
+    def finalize(self):
+        self._end_indent()
+        blocks = []
+        if "steps" in self.sfc:
+            blocks.append("\n\n".join(self.sfc[name] for name in _SFC_PARTS if name in self.sfc))
+        blocks.extend(self.fenced)
+        blocks.extend(self.indented)
+        if not blocks and len(self.plc_lines) >= 3:
+            blocks.append("\n".join(self.plc_lines))
+        return blocks
+
+    def _feed_clean(self, line):
+        if len(self.sfc) < len(_SFC_PARTS):
+            self._feed_sfc(line)
+        if not self._has_blocks() and _PLC_KEYWORDS_RE.search(line):
+            self.plc_lines.extend(ln for ln in line.splitlines() if _PLC_KEYWORDS_RE.search(ln))
+        self._feed_fences(line)
+        if line.startswith("    ") and len(line) > 4:
+            self._indent.append(line)
+        else:
+            self._end_indent()
+
+    def _feed_fences(self, line):
+        # Fences pair up left to right across the whole output, so one line can open and close several.
+        pos = 0
+        while True:
+            at = line.find(_FENCE, pos)
+            if self._fence is not None:
+                if at < 0:
+                    self._fence.append(line[pos:] + "\n")
+                    return
+                self._fence.append(line[pos:at])
+                self._add_block(self.fenced, "".join(self._fence))
+                self._fence = None
+            elif at < 0:
+                return
+            else:
+                rest = line[at + 3:]
+                # A bare language tag ending the opening line is not part of the block.
+                skip = _FENCE not in rest and _FENCE_TAG_RE.fullmatch(rest)
+                self._fence = []
+                if skip:
+                    return
+            pos = at + 3
+
+    def _end_indent(self):
+        if self._indent:
+            block = "\n".join(self._indent)
+            self._add_block(self.indented,
+                            "\n".join(ln[4:] if ln.startswith("    ") else ln for ln in block.splitlines()))
+            self._indent = []
+
+    def _feed_sfc(self, line):
+        if not (self._pending or self._open_list) and not _SFC_NAME_RE.search(line):
+            return  # every assignment starts with its part's name; skip the per-part regexes on plain log lines
+        for name in _SFC_PARTS:
+            if name in self.sfc:
+                continue
+            if name in self._open_list:
+                self._close_list(name, self._open_list.pop(name), line + "\n")
+                continue
+            text = self._pending.pop(name, "") + line + "\n"
+            m = _SFC_START_RE[name].search(text)
+            if m is None:
+                tail = _SFC_TAIL_RE[name].search(text)
+                if tail is not None:
+                    self._pending[name] = text[tail.start():]
+            elif name == "initial_step":
+                self._add_sfc(name, m.group())
+            else:
+                self._close_list(name, [text[m.start():m.end()]], text[m.end():])
+
+    def _close_list(self, name, pieces, text):
+        end = text.find("]")
+        if end < 0:
+            pieces.append(text)
+            self._open_list[name] = pieces
+        else:
+            pieces.append(text[:end + 1])
+            self._add_sfc(name, "".join(pieces))
+
+    def _add_sfc(self, name, text):
+        self.sfc[name] = text.strip()
+        if name == "steps":
+            self.plc_lines = []
+
+    def _has_blocks(self):
+        return bool(self.fenced or self.indented or "steps" in self.sfc)
+
+    def _add_block(self, target, text):
+        if text.strip():
+            target.append(text.strip())
+            self.plc_lines = []
+
+
+def extract_blocks(full_output: str):
+    if not full_output:
+        return []
+    out = sanitize_text(full_output)
+    if _FENCE not in out and "\n    " not in out and not out.startswith("    ") and not _SFC_NAME_RE.search(out):
+        # Nothing the structured extractors could match: only the PLC keyword fallback applies.
+        plc_lines = list(filter(_PLC_KEYWORDS_RE.search, out.splitlines()))
+        return ["\n".join(plc_lines)] if len(plc_lines) >= 3 else []
+    extractor = IncrementalSFCExtractor()
+    for line in out.split("\n"):
+        extractor._feed_clean(line)
+    return extractor.finalize()
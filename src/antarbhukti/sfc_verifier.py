@@ -4,8 +4,111 @@ import os
 import z3
 import re
 import ast
+from functools import lru_cache
+import numpy as np
 from sfc import SFC
 
+
+def _incidence_table(ends, n):
+    """Row p lists, in increasing order, the transitions t with ends[t] == p, padded with -1."""
+    counts = np.bincount(ends, minlength=n)
+    order = np.argsort(ends, kind="stable")
+    rank = np.arange(len(ends)) - np.repeat(np.cumsum(counts) - counts, counts)
+    table = np.full((n, counts.max(initial=0)), -1, np.int32)
+    table[ends[order], rank] = order
+    return table
+
+
+def _petri_kernel(src, tgt, n):
+    """
+    Preset/postset tables of a net with n places whose transition t goes from src[t] to tgt[t].
+    Row p lists the transitions entering (preset) or leaving (postset) place p, padded with -1.
+    """
+    return _incidence_table(tgt, n), _incidence_table(src, n)
+
+
+def _cycle_kernel(src, tgt, n):
+    """on_cycle[p] is True when p can reach itself again by firing transitions (a back edge)."""
+    reach = np.zeros((n, n), np.bool_)
+    reach[src, tgt] = True
+    # Boolean transitive closure by repeated squaring: each round doubles the path length covered.
+    while True:
+        closure = reach | (reach @ reach)
+        if np.array_equal(closure, reach):
+            return np.diagonal(reach).copy()
+        reach = closure
+
+
+def _sfc_snapshot(sfc):
+    """Immutable copy of the chart (steps, transitions, variables, initial step) for cache keys."""
+    def arc_end(end):
+        return tuple(end) if isinstance(end, list) else end
+    return (
+        tuple((step["name"], step["function"]) for step in sfc.steps),
+        tuple((arc_end(t["src"]), arc_end(t["tgt"]), t.get("guard", "")) for t in sfc.transitions),
+        tuple(sfc.variables),
+        sfc.initial_step,
+    )
+
+
+@lru_cache(maxsize=256)
+def _sfc_to_petrinet(snapshot):
+    # Rebuilt from the snapshot, so the cache never holds (or sees edits to) the caller's SFC.
+    steps, transitions, variables, initial_step = snapshot
+    def arc_end(end):
+        return list(end) if isinstance(end, tuple) else end
+    sfc = SFC()
+    sfc.steps = [{"name": name, "function": function} for name, function in steps]
+    sfc.transitions = [{"src": arc_end(src), "tgt": arc_end(tgt), "guard": guard}
+                       for src, tgt, guard in transitions]
+    sfc.variables = list(variables)
+    sfc.initial_step = initial_step
+    return sfc.to_pn()
+
+
+@lru_cache(maxsize=256)
+def _cut_points(places, transitions, input_arcs, output_arcs, initial_marking):
+    out_transitions = {p: set() for p in places}
+    in_transitions = {p: set() for p in places}
+    trans_to_places = {t: set() for t in transitions}
+    for (p, t) in input_arcs:
+        if p in out_transitions:
+            out_transitions[p].add(t)
+    for (t, p) in output_arcs:
+        if p in in_transitions:
+            in_transitions[p].add(t)
+        if t in trans_to_places:
+            trans_to_places[t].add(p)
+    cut_points = set()
+    for p in initial_marking:
+        cut_points.add(p)
+    for p, outs in out_transitions.items():
+        if len(outs) > 1:
+            cut_points.add(p)
+    for p in places:
+        if len(out_transitions[p]) == 0:
+            cut_points.add(p)
+    def has_back_edge(start_place):
+        stack = []
+        visited = set()
+        for t in out_transitions[start_place]:
+            for p2 in trans_to_places[t]:
+                stack.append((p2, t))
+        while stack:
+            p, last_t = stack.pop()
+            if p == start_place:
+                return True
+            for t2 in out_transitions.get(p, []):
+                if (p, t2) not in visited:
+                    visited.add((p, t2))
+                    for p2 in trans_to_places[t2]:
+                        stack.append((p2, t2))
+        return False
+    for p in places:
+        if has_back_edge(p):
+            cut_points.add(p)
+    return tuple(sorted(cut_points))
+
 class Verifier:
     """Petri Net Model Containment Verifier with Dynamic Type Inference"""
     
@@ -74,47 +177,63 @@ class Verifier:
         out = walk(node)
         return out
 
+    def sfc_to_petrinet(self, sfc):
+        """
+        Convert an SFC to its Petri net dictionary (see SFC.to_pn).
+
+        Nets are cached by SFC content; each call gets its own copy of every field, so callers may
+        modify the result.
+        """
+        pn = _sfc_to_petrinet(_sfc_snapshot(sfc))
+        return {key: value.copy() for key, value in pn.items()}
+
+    def sfc_to_petrinet_soa(self, src, tgt, n_steps, initial_id=0):
+        """
+        Struct-of-arrays Petri net for an SFC whose steps are numbered 0..n_steps-1.
+
+        src[k] and tgt[k] are the step ids of transition k (one source and one target each).
+        Places and transitions are their integer ids, the arcs are (n, 2) int32 arrays, preset and
+        postset are the per-place tables from _petri_kernel and the initial marking is a uint8
+        token count per place.
+        """
+        src = np.asarray(src, dtype=np.int32)
+        tgt = np.asarray(tgt, dtype=np.int32)
+        trans = np.arange(len(src), dtype=np.int32)
+        preset, postset = _petri_kernel(src, tgt, n_steps)
+        marking = np.zeros(n_steps, dtype=np.uint8)
+        if n_steps:
+            marking[initial_id] = 1
+        return {
+            "places": np.arange(n_steps, dtype=np.int32),
+            "transitions": trans,
+            "src": src,
+            "tgt": tgt,
+            "input_arcs": np.stack((src, trans), axis=1),
+            "output_arcs": np.stack((trans, tgt), axis=1),
+            "preset": preset,
+            "postset": postset,
+            "initial_marking": marking
+        }
+
     def find_cut_points(self, pn):
-        out_transitions = {p: set() for p in pn["places"]}
-        in_transitions = {p: set() for p in pn["places"]}
-        trans_to_places = {t: set() for t in pn["transitions"]}
-        for (p, t) in pn["input_arcs"]:
-            if p in out_transitions:
-                out_transitions[p].add(t)
-        for (t, p) in pn["output_arcs"]:
-            if p in in_transitions:
-                in_transitions[p].add(t)
-            if t in trans_to_places:
-                trans_to_places[t].add(p)
-        cut_points = set()
-        for p in pn["initial_marking"]:
-            cut_points.add(p)
-        for p, outs in out_transitions.items():
-            if len(outs) > 1:
-                cut_points.add(p)
-        for p in pn["places"]:
-            if len(out_transitions[p]) == 0:
-                cut_points.add(p)
-        def has_back_edge(start_place):
-            stack = []
-            visited = set()
-            for t in out_transitions[start_place]:
-                for p2 in trans_to_places[t]:
-                    stack.append((p2, t))
-            while stack:
-                p, last_t = stack.pop()
-                if p == start_place:
-                    return True
-                for t2 in out_transitions.get(p, []):
-                    if (p, t2) not in visited:
-                        visited.add((p, t2))
-                        for p2 in trans_to_places[t2]:
-                            stack.append((p2, t2))
-            return False
-        for p in pn["places"]:
-            if has_back_edge(p):
-                cut_points.add(p)
-        return sorted(list(cut_points))
+        # The net is flattened to tuples so structurally equal nets share one cached result.
+        cut_points = _cut_points(
+            tuple(pn["places"]),
+            tuple(pn["transitions"]),
+            tuple(map(tuple, pn["input_arcs"])),
+            tuple(map(tuple, pn["output_arcs"])),
+            tuple(pn["initial_marking"]),
+        )
+        return list(cut_points)
+
+    def find_cut_points_soa(self, pn):
+        """find_cut_points for a net from sfc_to_petrinet_soa; returns the sorted cut place ids."""
+        n = len(pn["places"])
+        out_degree = np.bincount(pn["src"], minlength=n)
+        # initial places, branch and final places, and places on a cycle (back edge)
+        on_cycle = _cycle_kernel(pn["src"], pn["tgt"], n)
+        cut = (pn["initial_marking"] > 0) | (out_degree != 1) | on_cycle
+        return np.flatnonzero(cut)
 
     def cutpoint_to_cutpoint_paths_with_conditions(self, sfc, pn, cutpoints, allowed_variables=None):
         out_transitions = {p: set() for p in pn["places"]}
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the benchmark SFC examples.
+Tests cover the generated example runners against the reference implementations, the OSCAT
+FSM executors and minimisation and the reliability benchmarks' guard dispatch.
+"""
+
+import importlib.util
+import itertools
+import random
+from pathlib import Path
+
+import pytest
+
+from benchmarks.Benchmarks import run_example
+from benchmarks.reference_impls import REFERENCES, reference_inputs
+
+
+def _load(module_name, file_name):
+    # The OSCAT modules' file names are not identifiers, so they are loaded from their paths.
+    spec = importlib.util.spec_from_file_location(
+        module_name, Path(__file__).resolve().parent.parent / "benchmarks" / file_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+oscat = _load("oscat_source", "Benchmark-Source-OSCAT.py")
+reliability = _load("reliability_oscat", "ReliabilityRelatedBechmarks-OSCAT.py")
+
+
+def _mergeable_spec():
+    """Init branches into two steps with the same function and successor, so they merge."""
+    Step, Transition = oscat.Step, oscat.Transition
+    return oscat.FSMSpec(
+        "Mergeable",
+        (Step("Init", "out := 0"), Step("Check", ""), Step("High", "out := 1"),
+         Step("Also", "out := 1"), Step("End", "")),
+        (
+            Transition("Init", "Check", "init"),
+            Transition("Check", "High", "x > 1"),
+            Transition("Check", "Also", "x == 1"),
+            Transition("High", "End", "True"),
+            Transition("Also", "End", "True"),
+            Transition("End", "Check", "x == 0"),
+        ),
+        ("x", "out", "init"),
+    )
+
+
+class TestRunExample:
+    """Test suite for benchmarks.Benchmarks.run_example."""
+
+    @pytest.mark.parametrize("example", sorted(REFERENCES))
+    def test_matches_reference(self, example):
+        """Test every example agrees with its reference on small inputs."""
+        variable, reference = REFERENCES[example]
+        inputs = reference_inputs(example)
+        for values in itertools.product(range(2, 6), repeat=len(inputs)):
+            kwargs = dict(zip(inputs, values))
+            assert run_example(example - 1, **kwargs)[variable] == reference(**kwargs), kwargs
+
+    def test_variable_named_i(self):
+        """Test an example with a variable called i still takes it as an input."""
+        result = run_example(0, i=0, n=4)
+        assert result["sum"] == 10
+
+
+class TestReferences:
+    """Test suite for benchmarks.reference_impls."""
+
+    def test_reference_inputs(self):
+        """Test the declared inputs come from the reference signatures."""
+        assert reference_inputs(1) == ("n",)
+        assert reference_inputs(4) == ("a", "b")
+        assert reference_inputs(16) == ("n",)
+
+    def test_beyond_int64(self):
+        """Test references stay exact for values outside the int64 range."""
+        big = 2 ** 70
+        assert REFERENCES[15][1](n=5 ** 30) == (5 ** 30 - 1) // 4
+        assert REFERENCES[18][1](a=big * 3, b=big * 5) == big
+        assert REFERENCES[13][1](n=25) == 15511210043330985984000000
+
+
+class TestRecords:
+    """Test suite for the OSCAT FSM records."""
+
+    def test_dict_style_access(self):
+        """Test fields read by name at every level, like the former dict records."""
+        spec = _mergeable_spec()
+        assert spec["steps"][0]["name"] == "Init"
+        assert spec["transitions"][1]["guard"] == "x > 1"
+        assert spec["steps"][0][1] == "out := 0"
+        with pytest.raises(KeyError):
+            spec["transitions"][0]["name"]
+
+
+class TestExecutors:
+    """Test suite for the OSCAT FSM executors, checked against run_fsm."""
+
+    N_TRACES = 20
+    N_CYCLES = 12
+
+    @classmethod
+    def _traces(cls, spec):
+        assigned = {a.split(":=")[0].strip()
+                    for step in spec.steps for a in step.function.split(";") if ":=" in a}
+        inputs = [v for v in spec.variables if v not in assigned]
+        rng = random.Random(spec.name)
+        return [[{v: rng.randint(0, 3) for v in inputs} for _ in range(cls.N_CYCLES)]
+                for _ in range(cls.N_TRACES)]
+
+    @staticmethod
+    def _outcome(run, trace):
+        try:
+            return run(trace)
+        except ArithmeticError as e:  # e.g. "% mod" with mod == 0 must fail in every executor
+            return type(e)
+
+    @pytest.mark.parametrize("spec", oscat._examples(), ids=lambda spec: spec.name)
+    def test_match_run_fsm(self, spec):
+        """Test every executor gives run_fsm's final variables and step sequence on random traces."""
+        traces = self._traces(spec)
+        expected = [self._outcome(lambda trace: oscat.run_fsm(spec, trace), trace) for trace in traces]
+        # For one-shot FSMs run_fsm is _run_trivial, so the generated code is what checks that path.
+        run = oscat.compile_fsm(spec)
+        assert [self._outcome(run, trace) for trace in traces] == expected
+        assert [self._outcome(lambda trace: oscat.run_cached(spec.name, trace), trace)
+                for trace in traces] == expected
+        ok = [i for i, result in enumerate(expected) if isinstance(result, tuple)]
+        assert oscat.run_batch(spec, [traces[i] for i in ok]) == [expected[i] for i in ok]
+
+        # run_lanes takes one lane per trace: inputs[v][cycle][lane].
+        inputs = {v: [[traces[i][cycle][v] for i in ok] for cycle in range(self.N_CYCLES)] for v in traces[0][0]}
+        if not ok:
+            return
+        env, visited = oscat.run_lanes(spec, inputs, self.N_CYCLES)
+        states = oscat.encode(spec).states
+        for lane, i in enumerate(ok):
+            expected_env, expected_visited = expected[i]
+            assert tuple(states[s] for s in visited[:, lane]) == expected_visited
+            assert {v: env[v][lane] for v in spec.variables} == expected_env
+
+    def test_lanes_zero_divisor(self):
+        """Test run_lanes raises like run_fsm only when an active lane divides by zero."""
+        spec = oscat.get_example("Modulo Counter")
+        traces = [[{"init": 1, "enable": 1, "mod": 3}] * 4, [{"init": 1, "enable": 0, "mod": 0}] * 4]
+        inputs = {v: [[trace[cycle][v] for trace in traces] for cycle in range(4)] for v in traces[0][0]}
+        env, visited = oscat.run_lanes(spec, inputs, 4)
+        for lane, trace in enumerate(traces):
+            expected_env, _ = oscat.run_fsm(spec, trace)
+            assert {v: env[v][lane] for v in spec.variables} == expected_env
+        inputs["enable"] = [[1, 1]] * 4
+        with pytest.raises(ZeroDivisionError):
+            oscat.run_lanes(spec, inputs, 4)
+
+
+class TestMinimize:
+    """Test suite for the OSCAT FSM minimisation."""
+
+    @staticmethod
+    def _assert_equivalent(spec, minimized, n_traces=50, n_cycles=12):
+        assigned = {a.split(":=")[0].strip()
+                    for step in spec.steps for a in step.function.split(";") if ":=" in a}
+        inputs = [v for v in spec.variables if v not in assigned]
+        functions = {step.name: step.function for step in spec.steps}
+        rng = random.Random(spec.name)
+
+        def outcome(fsm, trace):
+            try:
+                env, visited = oscat.run_fsm(fsm, trace)
+            except ArithmeticError as e:  # e.g. "% mod" with mod == 0 must fail in both
+                return type(e)
+            # Merged steps keep one name, so compare the functions the run executed.
+            return env, [functions[s] for s in visited]
+
+        for _ in range(n_traces):
+            trace = [{v: rng.randint(0, 3) for v in inputs} for _ in range(n_cycles)]
+            assert outcome(minimized, trace) == outcome(spec, trace), trace
+
+    @pytest.mark.parametrize("spec", oscat._build_specs(), ids=lambda spec: spec.name)
+    def test_benchmark_fsms_equivalent(self, spec):
+        """Test every benchmark FSM behaves the same after minimisation."""
+        self._assert_equivalent(spec, oscat.minimize(spec))
+
+    def test_merges_equivalent_steps(self):
+        """Test steps with the same function and successors are merged."""
+        spec = _mergeable_spec()
+        minimized = oscat.minimize(spec)
+        assert [s.name for s in minimized.steps] == ["Init", "Check", "High", "End"]
+        assert oscat.Transition("Check", "High", "x == 1") in minimized.transitions
+        self._assert_equivalent(spec, minimized)
+
+
+class TestGuardDispatch:
+    """Test suite for the reliability benchmarks' guard codes."""
+
+    VARIABLES = ("level", "LOW", "running")
+
+    @pytest.mark.parametrize("guard, kind", [
+        ("True", 0),
+        ("true", 0),
+        ("running", 1),
+        ("level < LOW", 2),
+        ("level >= LOW", 2),
+        ("running == true", 3),
+        ("level != 2", 3),
+        ("running == true and level > LOW", 4),
+        ("not running", 4),
+    ])
+    def test_kinds_match_eval(self, guard, kind):
+        """Test every guard kind evaluates like eval() on the guard string."""
+        code = reliability.classify_guard(guard, self.VARIABLES)
+        assert code[3] == kind
+        for state in itertools.product((0, 1, 2, 3), (0, 2), (False, True)):
+            expected = bool(eval(guard, {"true": True, "false": False}, dict(zip(self.VARIABLES, state))))
+            assert reliability.eval_guard(code, state) == expected, state
+
+    def test_generic_guards_are_shared(self):
+        """Test reclassifying a GENERIC guard reuses its compiled entry."""
+        guard = "level > LOW or running"
+        code = reliability.classify_guard(guard, self.VARIABLES)
+        size = len(reliability._GENERIC)
+        reliability.classify_guard.cache_clear()
+        assert reliability.classify_guard(guard, self.VARIABLES) == code
+        assert len(reliability._GENERIC) == size
+
+    def test_benchmark_guards_match_eval(self):
+        """Test the guard codes of every reliability system against eval()."""
+        rng = random.Random(0)
+        for name, sfc in reliability.sfc_examples.items():
+            variables = sfc["variables"]
+            for _ in range(20):
+                state = [rng.choice((0, 1, 2, 3, True, False)) for _ in variables]
+                env = dict(zip(variables, state))
+                for t, code in zip(sfc["transitions"], reliability.guard_codes(name)):
+                    expected = bool(eval(t["guard"], {"true": True, "false": False}, env))
+                    assert reliability.eval_guard(code, state) == expected, (name, t["guard"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the driver output block extractor.
+Tests compare the line-at-a-time extractor with the whole-output regexes it replaced.
+"""
+
+import random
+import re
+
+import pytest
+
+from src.antarbhukti.blockextract import IncrementalSFCExtractor, extract_blocks, sanitize_text
+
+
+def _regex_extract_blocks(full_output):
+    """The former whole-output extractor, kept as the reference."""
+    out = sanitize_text(full_output or "")
+    blocks = []
+
+    fenced = re.findall(r"```(?:\w*\n)?([\s\S]*?)```", out)
+    blocks.extend([b.strip() for b in fenced if b.strip()])
+
+    for m in re.finditer(r"(?:^|\n)((?: {4}.+(?:\n|$))+)", out):
+        block = m.group(1)
+        cleaned = "\n".join([ln[4:] if ln.startswith("    ") else ln for ln in block.splitlines()])
+        if cleaned.strip():
+            blocks.append(cleaned.strip())
+
+    sfc_parts = []
+    steps_match = re.search(r"(steps\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
+    if steps_match:
+        sfc_parts.append(steps_match.group(1).strip())
+        transitions_match = re.search(r"(transitions\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
+        if transitions_match:
+            sfc_parts.append(transitions_match.group(1).strip())
+        variables_match = re.search(r"(variables\s*=\s*\[([\s\S]*?)\])", out, flags=re.IGNORECASE)
+        if variables_match:
+            sfc_parts.append(variables_match.group(1).strip())
+        init_match = re.search(r"(initial_step\s*=\s*['\"].+?['\"])", out, flags=re.IGNORECASE)
+        if init_match:
+            sfc_parts.append(init_match.group(1).strip())
+
+    if sfc_parts:
+        blocks.insert(0, "\n\n".join(sfc_parts))
+
+    plc_keywords = ["STEP", "STATE", "TRANSITION", "IF", "THEN", "ELSE", ":=", "="]
+    plc_lines = [ln for ln in out.splitlines() if any(k in ln for k in plc_keywords)]
+    if len(plc_lines) >= 3 and not blocks:
+        blocks.append("\n".join(plc_lines))
+
+    return blocks
+
+
+CORPUS = [
+    "",
+    "plain log line\nanother one",
+    "    x := 1\n    y := 2\n```\ncode\n```",
+    "```a``` and ```b```",
+    "steps =\n[1, 2]",
+    "steps = [\n  {'name': 'S0'},\n  {'name': 'S1'}\n]\ntransitions = [{'src': 'S0', 'tgt': 'S1'}]\n"
+    "variables = ['n', 'i']\ninitial_step = 'S0'",
+    "Here it is: ```python\nsteps = [1]\n```\nsteps = [1]",
+    "```python\n    indented inside\n```\n    after",
+    "initial_step = 'S0'\nsteps = [\n",
+    "initial_step =\n  \"S0\"\nSTEPS\n=\n[a]",
+    "Transitions = [t]\nsteps = [s]\nvariables=[v] variables=[w]",
+    "IF a THEN\nb := 1\nELSE\nc := 2",
+    "STEP one\nSTATE two",
+    "```\nnever closed\n    still indented",
+    "````x```",
+    "``````",
+    "```tag\n```",
+    "```tag more\nbody\n```",
+    "text ```tag\nbody``` tail ```x\ny\n```",
+    "     \n    a\n\n    b\n",
+    "\x1b[32m    coloured\x1b[0m\nsteps → [1]",
+    "stepsteps = [x] and steps=[y]",
+    "initial_step = 'a\ninitial_step = \"b\"",
+]
+
+
+class TestExtractBlocks:
+    """Test suite for src.antarbhukti.blockextract."""
+
+    @pytest.mark.parametrize("output", CORPUS)
+    def test_matches_regex_extractor(self, output):
+        """Test the corpus gives the same blocks as the former regexes."""
+        assert extract_blocks(output) == _regex_extract_blocks(output)
+
+    @pytest.mark.parametrize("output", CORPUS)
+    def test_incremental_matches_regex_extractor(self, output):
+        """Test feeding the output line by line gives the same blocks."""
+        extractor = IncrementalSFCExtractor()
+        for line in output.split("\n"):
+            extractor.feed(line)
+        assert extractor.finalize() == _regex_extract_blocks(output)
+
+    def test_reported_cases(self):
+        """Test indented blocks next to fences, several fences per line and a list on the next line."""
+        assert extract_blocks("    x := 1\n    y := 2\n```\ncode\n```") == ["code", "x := 1\ny := 2"]
+        assert extract_blocks("```a``` and ```b```") == ["a", "b"]
+        assert extract_blocks("steps =\n[1, 2]") == ["steps =\n[1, 2]"]
+
+    def test_random_outputs(self):
+        """Test random mixes of the syntax the extractors look for."""
+        pieces = ["```", "```py", "    ", "  ", "\n", "\n\n", "steps", "STEPS", "transitions", "variables",
+                  "initial_step", " = ", "=", "[", "]", "'S0'", "\"", "x := 1", "IF", "THEN", "a", " "]
+        rng = random.Random(0)
+        for _ in range(3000):
+            output = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+            assert extract_blocks(output) == _regex_extract_blocks(output), output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
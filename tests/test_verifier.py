@@ -313,6 +313,74 @@ class TestVerifier:
             assert isinstance(transition_id, str)
             assert isinstance(guard, str)
 
+    def _inline_sfc(self):
+        sfc = SFC()
+        sfc.steps = [
+            {"name": "Start", "function": "counter := 0"},
+            {"name": "Process", "function": "counter := counter + 1"},
+            {"name": "End", "function": ""},
+        ]
+        sfc.transitions = [
+            {"src": "Start", "tgt": "Process", "guard": "True"},
+            {"src": "Process", "tgt": "End", "guard": "counter >= 3"},
+        ]
+        sfc.variables = ["counter"]
+        sfc.initial_step = "Start"
+        return sfc
+
+    def test_sfc_to_petrinet_is_cached_by_content(self):
+        """Test equal SFCs give equal nets that callers can modify independently."""
+        pn1 = self.verifier.sfc_to_petrinet(self._inline_sfc())
+        pn2 = self.verifier.sfc_to_petrinet(self._inline_sfc())
+        assert pn1 == pn2
+        assert pn1["places"] is not pn2["places"]
+
+        pn1["places"].append("Extra")
+        pn1["transition_guards"]["t_0"] = "False"
+        pn3 = self.verifier.sfc_to_petrinet(self._inline_sfc())
+        assert pn3 == pn2
+        assert self.verifier.find_cut_points(pn3) == self.verifier.find_cut_points(dict(pn3))
+
+    def test_mutated_sfc_gets_fresh_petrinet(self):
+        """Test editing an SFC after conversion is reflected in the next conversion."""
+        sfc = self._inline_sfc()
+        before = self.verifier.sfc_to_petrinet(sfc)
+
+        sfc.steps.append({"name": "Done", "function": ""})
+        sfc.transitions.append({"src": "End", "tgt": "Done", "guard": "True"})
+        after = self.verifier.sfc_to_petrinet(sfc)
+
+        assert "Done" not in before["places"]
+        assert "Done" in after["places"]
+        assert after == sfc.to_pn()
+        assert "Done" in self.verifier.find_cut_points(after)
+
+    def test_soa_cut_points_match_dict_form(self):
+        """Test the struct-of-arrays Petri net yields the same cut points."""
+        sfc = SFC()
+        sfc.steps = [
+            {"name": "Start", "function": "i := 0"},
+            {"name": "Check", "function": ""},
+            {"name": "Inc", "function": "i := i + 1"},
+            {"name": "End", "function": ""},
+        ]
+        sfc.transitions = [
+            {"src": "Start", "tgt": "Check", "guard": "True"},
+            {"src": "Check", "tgt": "Inc", "guard": "i < n"},
+            {"src": "Inc", "tgt": "Check", "guard": "True"},
+            {"src": "Check", "tgt": "End", "guard": "i >= n"},
+        ]
+        sfc.initial_step = "Start"
+
+        pn = self.verifier.sfc_to_petrinet_soa([0, 1, 2, 1], [1, 2, 1, 3], 4)
+        assert pn["initial_marking"].tolist() == [1, 0, 0, 0]
+        assert pn["input_arcs"].tolist() == [[0, 0], [1, 1], [2, 2], [1, 3]]
+
+        names = sfc.step_names()
+        cut_ids = self.verifier.find_cut_points_soa(pn)
+        expected = self.verifier.find_cut_points(self.verifier.sfc_to_petrinet(sfc))
+        assert sorted(names[i] for i in cut_ids) == expected
+
 
 if __name__ == "__main__":
     pytest.main([__file__])